@@ -10,17 +10,26 @@ Example:
 """
 
 import argparse
+import heapq
 import json
 import os
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+try:
+    # orjson parses UTF-8 bytes with SIMD acceleration; trace ingestion is
+    # dominated by JSON decode, so use it when available.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+
+@dataclass(slots=True)
 class LLMCall:
     """Represents a single LLM API call (request/response pair)."""
     agent_name: str
@@ -38,28 +47,63 @@ class LLMCall:
         return self.response_timestamp - self.request_timestamp
 
 
-@dataclass
+@dataclass(slots=True)
 class Invocation:
     """Represents a complete agent invocation (may have multiple LLM calls)."""
     invocation_id: str
     session_id: str
     invocation_timestamp: float
     llm_calls: list[LLMCall] = field(default_factory=list)
+    # Lookup index over llm_calls so request/response pairing during
+    # ingestion is O(1) instead of a linear scan per file.
+    _by_key: dict[tuple[str, int], LLMCall] = field(default_factory=dict)
+    # Memoized derived metrics. The report reads each of these several
+    # times per invocation, and calls are final once ingestion is done,
+    # so the O(N) passes over llm_calls only run once.
+    _start_time: Optional[float] = field(default=None, repr=False)
+    _end_time: Optional[float] = field(default=None, repr=False)
+    _total_llm_time: Optional[float] = field(default=None, repr=False)
+    _primary_agent: Optional[str] = field(default=None, repr=False)
+
+    def _compute_times(self) -> None:
+        """Fill the three time memos with a single pass over the calls.
+
+        start, end and LLM total all read the same two timestamp columns,
+        so one fused scan replaces three separate attribute walks.
+        """
+        calls = self.llm_calls
+        if not calls:
+            self._start_time = self._end_time = self.invocation_timestamp
+            self._total_llm_time = 0.0
+            return
+        start = self.invocation_timestamp
+        end = calls[0].response_timestamp
+        llm_total = 0.0
+        for c in calls:
+            req = c.request_timestamp
+            resp = c.response_timestamp
+            if req < start:
+                start = req
+            if resp > end:
+                end = resp
+            llm_total += resp - req
+        self._start_time = start
+        self._end_time = end
+        self._total_llm_time = llm_total
 
     @property
     def start_time(self) -> float:
         """Earliest timestamp in this invocation."""
-        if not self.llm_calls:
-            return self.invocation_timestamp
-        return min(self.invocation_timestamp,
-                   min(c.request_timestamp for c in self.llm_calls))
+        if self._start_time is None:
+            self._compute_times()
+        return self._start_time
 
     @property
     def end_time(self) -> float:
         """Latest timestamp in this invocation."""
-        if not self.llm_calls:
-            return self.invocation_timestamp
-        return max(c.response_timestamp for c in self.llm_calls)
+        if self._end_time is None:
+            self._compute_times()
+        return self._end_time
 
     @property
     def total_duration(self) -> float:
@@ -69,7 +113,9 @@ class Invocation:
     @property
     def total_llm_time(self) -> float:
         """Sum of all LLM call durations."""
-        return sum(c.duration for c in self.llm_calls)
+        if self._total_llm_time is None:
+            self._compute_times()
+        return self._total_llm_time
 
     @property
     def tool_time(self) -> float:
@@ -88,34 +134,55 @@ class Invocation:
         """The main agent for this invocation."""
         if not self.llm_calls:
             return "Unknown"
-        # Return the agent with the most calls, or first one
-        agents = [c.agent_name for c in self.llm_calls]
-        return max(set(agents), key=agents.count)
+        if self._primary_agent is None:
+            # Return the agent with the most calls, or first one
+            counts = Counter(c.agent_name for c in self.llm_calls)
+            self._primary_agent = counts.most_common(1)[0][0]
+        return self._primary_agent
 
     @property
     def user_query(self) -> Optional[str]:
         """Extract user query from first LLM call."""
-        for call in sorted(self.llm_calls, key=lambda c: c.call_num):
-            if call.user_query:
-                return call.user_query
-        return None
+        # Single min-scan over the calls; sorting them just to read the
+        # first non-empty query would be O(N log N) per access.
+        best: Optional[str] = None
+        best_num = 0
+        for call in self.llm_calls:
+            if call.user_query and (best is None or call.call_num < best_num):
+                best = call.user_query
+                best_num = call.call_num
+        return best
 
     @property
     def datetime(self) -> datetime:
-        """Invocation start as datetime."""
-        return datetime.fromtimestamp(self.invocation_timestamp)
+        """Invocation start as a UTC datetime.
+
+        UTC keeps the Analysis Period header on the same basis as the
+        per-row times from _hms.
+        """
+        return datetime.fromtimestamp(self.invocation_timestamp, tz=timezone.utc)
 
 
-def parse_trace_file(filepath: Path) -> dict:
+def parse_trace_file(filepath: str | Path) -> dict:
     """Parse a single trace JSON file."""
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        # Read bytes and decode in one shot: both orjson and stdlib json
+        # accept bytes, and skipping text-mode decoding avoids a full copy.
+        with open(filepath, 'rb') as f:
+            return _json_loads(f.read())
+    except (ValueError, IOError) as e:
         print(f"Warning: Could not parse {filepath}: {e}", file=sys.stderr)
         return {}
 
 
+# Field names that may carry the user query inside a JSON-encoded part.
+# A payload containing none of these quoted keys cannot yield a query, so
+# the parse is skipped for it entirely — large tool-call payloads are the
+# common case and dominate trace file size.
+_QUERY_FIELDS = ('question', 'request', 'query', 'message', 'prompt')
+_QUERY_FIELD_PROBES = tuple(f'"{name}"' for name in _QUERY_FIELDS)
+
+
 def extract_user_query(data: dict) -> Optional[str]:
     """Extract user query text from request data."""
     contents = data.get('contents', [])
@@ -127,130 +194,212 @@ def extract_user_query(data: dict) -> Optional[str]:
                 if not text:
                     continue
 
-                # If text is JSON, try to extract 'question' or 'request' field
-                if text.startswith('{'):
+                # If text is JSON, try to extract 'question' or 'request'
+                # field. Probe the first character directly and only pay
+                # for an lstrip copy when the payload starts with
+                # whitespace, which is rare.
+                first = text[0]
+                if first == '{' or (first in ' \t\r\n' and text.lstrip()[:1] == '{'):
+                    if not any(probe in text for probe in _QUERY_FIELD_PROBES):
+                        # No query key present: skip JSON-shaped payloads
+                        # without materializing them; anything else is
+                        # treated as plain text as before.
+                        if text.rstrip().endswith('}'):
+                            continue
+                        return text
                     try:
-                        json_data = json.loads(text)
+                        json_data = _json_loads(text)
                         # Try common field names for user queries
-                        for field in ['question', 'request', 'query', 'message', 'prompt']:
-                            if field in json_data:
-                                query = json_data[field]
-                                if isinstance(query, str):
-                                    return query
+                        for field in _QUERY_FIELDS:
+                            query = json_data.get(field)
+                            if isinstance(query, str):
+                                return query
                         # If no known field, skip this JSON
                         continue
-                    except json.JSONDecodeError:
+                    except ValueError:
                         pass  # Not valid JSON, treat as plain text
 
                 return text  # Return full query
     return None
 
 
+# Below this file count the pool startup costs more than it saves.
+_PARALLEL_THRESHOLD = 64
+
+# Trace file kinds; each filename is classified exactly once.
+_KIND_OTHER = 0
+_KIND_RAW_REQUEST = 1
+_KIND_RAW_RESPONSE = 2
+_KIND_REQUEST = 3
+
+
+def _classify(filename: str) -> int:
+    """Classify a trace filename by its suffix."""
+    if filename.endswith('_raw_request.json'):
+        return _KIND_RAW_REQUEST
+    if filename.endswith('_raw_response.json'):
+        return _KIND_RAW_RESPONSE
+    if filename.endswith('_request.json') and '_raw_' not in filename:
+        return _KIND_REQUEST
+    return _KIND_OTHER
+
+
+def _walk_json(root: Path) -> Iterator[tuple[str, str]]:
+    """Yield (path, filename) for every .json file under root.
+
+    An explicit os.scandir walk skips the per-entry Path construction
+    and extra stat calls that Path.rglob performs, which is noticeable
+    on directories with tens of thousands of trace files.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.json'):
+                    yield entry.path, entry.name
+
+
+def _parse_one(entry: tuple[str, str]) -> tuple[int, dict]:
+    """Parse one trace file and project only the fields used downstream.
+
+    Runs in worker processes; pre-projecting (including the already
+    extracted user query) keeps the pickled result small.
+    """
+    filepath, filename = entry
+    kind = _classify(filename)
+    if kind == _KIND_OTHER:
+        return kind, {}
+    data = parse_trace_file(filepath)
+    if not data or not data.get('invocation_id'):
+        return kind, {}
+
+    projected = {
+        'invocation_id': data['invocation_id'],
+        'session_id': data.get('session_id', ''),
+        'invocation_timestamp': float(data.get('invocation_timestamp', 0)),
+        'timestamp': float(data.get('timestamp', 0)),
+        'agent_name': data.get('agent_name', 'Unknown'),
+        'call_num': int(data.get('call_num', 0)),
+        'model': data.get('model', ''),
+    }
+    if kind != _KIND_RAW_RESPONSE:
+        projected['user_query'] = extract_user_query(data)
+    return kind, projected
+
+
 def collect_traces(traces_dir: Path) -> dict[str, Invocation]:
     """Collect all trace data from directory."""
     invocations: dict[str, Invocation] = {}
 
-    # Find all JSON files
-    for json_file in traces_dir.rglob('*.json'):
-        data = parse_trace_file(json_file)
-        if not data:
-            continue
-
-        inv_id = data.get('invocation_id')
-        if not inv_id:
-            continue
-
-        inv_ts = float(data.get('invocation_timestamp', 0))
-        session_id = data.get('session_id', '')
-
-        # Create invocation if needed
-        if inv_id not in invocations:
-            invocations[inv_id] = Invocation(
-                invocation_id=inv_id,
-                session_id=session_id,
-                invocation_timestamp=inv_ts
-            )
-
-        inv = invocations[inv_id]
-
-        # Parse based on file type
-        filename = json_file.name
-        timestamp = float(data.get('timestamp', 0))
-        agent_name = data.get('agent_name', 'Unknown')
-        call_num = int(data.get('call_num', 0))
-        model = data.get('model', '')
-
-        # For raw_request files, this is when request was sent
-        if '_raw_request.json' in filename:
-            # Find or create LLM call
-            call = None
-            for c in inv.llm_calls:
-                if c.agent_name == agent_name and c.call_num == call_num:
-                    call = c
-                    break
-
-            if not call:
-                call = LLMCall(
-                    agent_name=agent_name,
-                    call_num=call_num,
-                    model=model,
-                    request_timestamp=timestamp,
-                    response_timestamp=timestamp,  # Will be updated
+    # JSON decode is CPU-bound, so fan the parse out across cores; only
+    # the cheap merge below stays on the main process.
+    json_files = list(_walk_json(traces_dir))
+    with ProcessPoolExecutor() as pool:
+        if len(json_files) >= _PARALLEL_THRESHOLD:
+            parsed = pool.map(_parse_one, json_files, chunksize=64)
+        else:
+            parsed = map(_parse_one, json_files)
+
+        for kind, data in parsed:
+            if not data:
+                continue
+
+            inv_id = data['invocation_id']
+            inv_ts = data['invocation_timestamp']
+            session_id = data['session_id']
+
+            # Create invocation if needed
+            if inv_id not in invocations:
+                invocations[inv_id] = Invocation(
                     invocation_id=inv_id,
                     session_id=session_id,
-                    user_query=extract_user_query(data)
+                    invocation_timestamp=inv_ts
                 )
-                inv.llm_calls.append(call)
-            else:
-                call.request_timestamp = timestamp
-                if not call.user_query:
-                    call.user_query = extract_user_query(data)
-
-        # For raw_response files, this is when response was received
-        elif '_raw_response.json' in filename:
-            for call in inv.llm_calls:
-                if call.agent_name == agent_name and call.call_num == call_num:
+
+            inv = invocations[inv_id]
+
+            # Merge based on file type
+            timestamp = data['timestamp']
+            agent_name = data['agent_name']
+            call_num = data['call_num']
+            model = data['model']
+            call_key = (agent_name, call_num)
+
+            # For raw_request files, this is when request was sent
+            if kind == _KIND_RAW_REQUEST:
+                # Find or create LLM call
+                call = inv._by_key.get(call_key)
+
+                if not call:
+                    call = LLMCall(
+                        agent_name=agent_name,
+                        call_num=call_num,
+                        model=model,
+                        request_timestamp=timestamp,
+                        response_timestamp=timestamp,  # Will be updated
+                        invocation_id=inv_id,
+                        session_id=session_id,
+                        user_query=data.get('user_query')
+                    )
+                    inv.llm_calls.append(call)
+                    inv._by_key[call_key] = call
+                else:
+                    call.request_timestamp = timestamp
+                    if not call.user_query:
+                        call.user_query = data.get('user_query')
+
+            # For raw_response files, this is when response was received
+            elif kind == _KIND_RAW_RESPONSE:
+                call = inv._by_key.get(call_key)
+                if call:
                     call.response_timestamp = timestamp
-                    break
-            else:
-                # Response without request - create call
-                call = LLMCall(
-                    agent_name=agent_name,
-                    call_num=call_num,
-                    model=model,
-                    request_timestamp=timestamp,
-                    response_timestamp=timestamp,
-                    invocation_id=inv_id,
-                    session_id=session_id
-                )
-                inv.llm_calls.append(call)
-
-        # For request.json (not raw), extract user query if available
-        elif '_request.json' in filename and '_raw_' not in filename:
-            user_query = extract_user_query(data)
-            if user_query:
-                for call in inv.llm_calls:
-                    if call.agent_name == agent_name and call.call_num == call_num:
-                        if not call.user_query:
-                            call.user_query = user_query
-                        break
+                else:
+                    # Response without request - create call
+                    call = LLMCall(
+                        agent_name=agent_name,
+                        call_num=call_num,
+                        model=model,
+                        request_timestamp=timestamp,
+                        response_timestamp=timestamp,
+                        invocation_id=inv_id,
+                        session_id=session_id
+                    )
+                    inv.llm_calls.append(call)
+                    inv._by_key[call_key] = call
+
+            # For request.json (not raw), attach the user query if available
+            elif kind == _KIND_REQUEST:
+                user_query = data.get('user_query')
+                if user_query:
+                    call = inv._by_key.get(call_key)
+                    if call and not call.user_query:
+                        call.user_query = user_query
 
     return invocations
 
 
-def calculate_statistics(invocations: list[Invocation]) -> dict:
-    """Calculate summary statistics."""
-    total_times = [i.total_duration for i in invocations]
+def calculate_statistics(invocations: list[Invocation],
+                         total_times: list[float]) -> dict:
+    """Calculate summary statistics.
+
+    ``total_times`` is the pre-built duration column for ``invocations``;
+    the caller shares it with calculate_distribution so each consumer
+    does not rebuild the same list.
+    """
     llm_times = [i.total_llm_time for i in invocations]
     tool_times = [i.tool_time for i in invocations]
 
     def stats(values):
         if not values:
             return {'min': 0, 'max': 0, 'avg': 0, 'median': 0}
+        # The sort already yields min and max at its ends; sum is the
+        # only other pass needed, instead of four walks over the list.
         sorted_v = sorted(values)
         return {
-            'min': min(values),
-            'max': max(values),
+            'min': sorted_v[0],
+            'max': sorted_v[-1],
             'avg': sum(values) / len(values),
             'median': sorted_v[len(sorted_v) // 2]
         }
@@ -272,21 +421,28 @@ def calculate_agent_stats(invocations: list[Invocation]) -> dict:
 
     result = {}
     for agent, durations in agent_calls.items():
-        sorted_d = sorted(durations)
+        # One pass instead of separate min/max/sum walks.
+        lo = hi = durations[0]
+        total = 0.0
+        for d in durations:
+            if d < lo:
+                lo = d
+            elif d > hi:
+                hi = d
+            total += d
         result[agent] = {
             'calls': len(durations),
-            'min': min(durations),
-            'max': max(durations),
-            'avg': sum(durations) / len(durations),
-            'total': sum(durations)
+            'min': lo,
+            'max': hi,
+            'avg': total / len(durations),
+            'total': total
         }
 
     return result
 
 
-def calculate_distribution(invocations: list[Invocation]) -> list[dict]:
-    """Calculate response time distribution."""
-    total_times = [i.total_duration for i in invocations]
+def calculate_distribution(total_times: list[float]) -> list[dict]:
+    """Calculate response time distribution over the duration column."""
     ranges = [(0, 5), (5, 10), (10, 20), (20, 30), (30, 60), (60, float('inf'))]
 
     result = []
@@ -317,192 +473,220 @@ def calculate_distribution(invocations: list[Invocation]) -> list[dict]:
     return result
 
 
-def generate_markdown_report(invocations: list[Invocation], namespace: str, pod: str) -> str:
-    """Generate markdown report from invocations."""
-    lines = []
+def _hms(ts: float) -> str:
+    """Format an epoch timestamp as UTC HH:MM:SS with integer math.
+
+    The tables render thousands of these; skipping the intermediate
+    datetime object avoids an allocation per cell, and the integer form
+    is genuinely UTC, matching the column headers.
+    """
+    t = int(ts) % 86400
+    return f"{t // 3600:02d}:{t % 3600 // 60:02d}:{t % 60:02d}"
+
+
+# Row template for the detailed invocation table, resolved once instead of
+# re-parsing an f-string with nine format specs per invocation.
+_DETAIL_ROW = ("| {i:2} | {time} | {inv_id:<26} | {agent:<23} | {calls:9} "
+               "| {total:8.2f}s | {llm:7.2f}s | {tools:7.2f}s | {pct:5.0f}% |")
 
+
+def iter_report_lines(invocations: list[Invocation], namespace: str, pod: str) -> Iterator[str]:
+    """Yield the markdown report line by line.
+
+    Streaming the lines lets the caller write incrementally, keeping
+    peak memory bounded regardless of invocation count.
+    """
     # Sort by timestamp
     invocations = sorted(invocations, key=lambda i: i.invocation_timestamp)
 
     total_calls = sum(len(i.llm_calls) for i in invocations)
-    stats = calculate_statistics(invocations)
+    # Build the duration column once and share it across the consumers.
+    total_times = [i.total_duration for i in invocations]
+    stats = calculate_statistics(invocations, total_times)
     agent_stats = calculate_agent_stats(invocations)
-    distribution = calculate_distribution(invocations)
+    distribution = calculate_distribution(total_times)
 
     # Header
-    lines.append("# LLM Trace Timing Analysis Report")
-    lines.append("")
-    lines.append(f"**Environment:** {namespace} (GKE)")
-    lines.append(f"**Pod:** {pod}")
-    lines.append(f"**Report Date:** {datetime.now().strftime('%Y-%m-%d')}")
+    yield "# LLM Trace Timing Analysis Report"
+    yield ""
+    yield f"**Environment:** {namespace} (GKE)"
+    yield f"**Pod:** {pod}"
+    yield f"**Report Date:** {datetime.now(timezone.utc).strftime('%Y-%m-%d')}"
     if invocations:
         start = invocations[0].datetime.strftime('%Y-%m-%d %H:%M')
         end = invocations[-1].datetime.strftime('%H:%M')
-        lines.append(f"**Analysis Period:** {start} - {end} UTC")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+        yield f"**Analysis Period:** {start} - {end} UTC"
+    yield ""
+    yield "---"
+    yield ""
 
     # Executive Summary
-    lines.append("## Executive Summary")
-    lines.append("")
-
-    critical_count = len([i for i in invocations if i.total_duration > 60])
+    yield "## Executive Summary"
+    yield ""
+
+    # One pass over the shared duration column instead of two list
+    # comprehensions plus a max() scan.
+    critical_count = 0
+    fast_count = 0
+    max_time = 0.0
+    for d in total_times:
+        if d > 60:
+            critical_count += 1
+        elif d < 10:
+            fast_count += 1
+        if d > max_time:
+            max_time = d
     critical_pct = critical_count / len(invocations) * 100 if invocations else 0
-    fast_count = len([i for i in invocations if i.total_duration < 10])
     fast_pct = fast_count / len(invocations) * 100 if invocations else 0
-    max_time = max(i.total_duration for i in invocations) if invocations else 0
-
-    lines.append(f"Analysis of {total_calls} LLM trace files across {len(invocations)} agent invocations reveals significant performance variability. "
-                 f"While {fast_pct:.0f}% of requests complete in under 10 seconds, {critical_pct:.0f}% exceed 60 seconds, "
-                 f"with the worst case reaching **{max_time:.0f} seconds ({max_time/60:.1f} minutes)**.")
-    lines.append("")
-
-    lines.append("| Metric                          | Value        |")
-    lines.append("|---------------------------------|--------------|")
-    lines.append(f"| Total Invocations Analyzed      | {len(invocations)}           |")
-    lines.append(f"| Total LLM API Calls             | {total_calls}          |")
-    lines.append(f"| Median Response Time            | {stats['total_time']['median']:.2f}s       |")
-    lines.append(f"| Average Response Time           | {stats['total_time']['avg']:.2f}s       |")
-    lines.append(f"| Requests Exceeding 60s          | {critical_count} ({critical_pct:.1f}%)   |")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+
+    yield (f"Analysis of {total_calls} LLM trace files across {len(invocations)} agent invocations reveals significant performance variability. "
+           f"While {fast_pct:.0f}% of requests complete in under 10 seconds, {critical_pct:.0f}% exceed 60 seconds, "
+           f"with the worst case reaching **{max_time:.0f} seconds ({max_time/60:.1f} minutes)**.")
+    yield ""
+
+    yield "| Metric                          | Value        |"
+    yield "|---------------------------------|--------------|"
+    yield f"| Total Invocations Analyzed      | {len(invocations)}           |"
+    yield f"| Total LLM API Calls             | {total_calls}          |"
+    yield f"| Median Response Time            | {stats['total_time']['median']:.2f}s       |"
+    yield f"| Average Response Time           | {stats['total_time']['avg']:.2f}s       |"
+    yield f"| Requests Exceeding 60s          | {critical_count} ({critical_pct:.1f}%)   |"
+    yield ""
+    yield "---"
+    yield ""
 
     # Summary Statistics
-    lines.append("## Summary Statistics")
-    lines.append("")
-    lines.append("| Metric                              |    Min |     Max |    Avg | Median |")
-    lines.append("|-------------------------------------|-------:|--------:|-------:|-------:|")
-    lines.append(f"| Total Invocation Time               | {stats['total_time']['min']:6.2f}s | {stats['total_time']['max']:7.2f}s | {stats['total_time']['avg']:6.2f}s | {stats['total_time']['median']:6.2f}s |")
-    lines.append(f"| LLM Call Time (Gemini API)          | {stats['llm_time']['min']:6.2f}s | {stats['llm_time']['max']:7.2f}s | {stats['llm_time']['avg']:6.2f}s | {stats['llm_time']['median']:6.2f}s |")
-    lines.append(f"| Processing Time (tools/graph)       | {stats['tool_time']['min']:6.2f}s | {stats['tool_time']['max']:7.2f}s | {stats['tool_time']['avg']:6.2f}s | {stats['tool_time']['median']:6.2f}s |")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    yield "## Summary Statistics"
+    yield ""
+    yield "| Metric                              |    Min |     Max |    Avg | Median |"
+    yield "|-------------------------------------|-------:|--------:|-------:|-------:|"
+    yield f"| Total Invocation Time               | {stats['total_time']['min']:6.2f}s | {stats['total_time']['max']:7.2f}s | {stats['total_time']['avg']:6.2f}s | {stats['total_time']['median']:6.2f}s |"
+    yield f"| LLM Call Time (Gemini API)          | {stats['llm_time']['min']:6.2f}s | {stats['llm_time']['max']:7.2f}s | {stats['llm_time']['avg']:6.2f}s | {stats['llm_time']['median']:6.2f}s |"
+    yield f"| Processing Time (tools/graph)       | {stats['tool_time']['min']:6.2f}s | {stats['tool_time']['max']:7.2f}s | {stats['tool_time']['avg']:6.2f}s | {stats['tool_time']['median']:6.2f}s |"
+    yield ""
+    yield "---"
+    yield ""
 
     # Agent Performance Summary
-    lines.append("## Agent Performance Summary")
-    lines.append("")
-    lines.append("| Agent                    | LLM Calls |    Min |     Max |    Avg |   Total |")
-    lines.append("|--------------------------|----------:|-------:|--------:|-------:|--------:|")
+    yield "## Agent Performance Summary"
+    yield ""
+    yield "| Agent                    | LLM Calls |    Min |     Max |    Avg |   Total |"
+    yield "|--------------------------|----------:|-------:|--------:|-------:|--------:|"
     for agent in sorted(agent_stats.keys()):
         s = agent_stats[agent]
-        lines.append(f"| {agent:<24} | {s['calls']:9} | {s['min']:6.2f}s | {s['max']:7.2f}s | {s['avg']:6.2f}s | {s['total']:7.1f}s |")
-    lines.append("")
-
-    lines.append("**Column Definitions:**")
-    lines.append("- **LLM Calls**: Number of round-trips to the Gemini API per invocation. Multiple calls occur due to the **agent loop pattern**:")
-    lines.append("  1. Agent sends query to LLM → LLM requests a tool (e.g., `query_graph`)")
-    lines.append("  2. Tool executes → result returned to LLM → LLM may request another tool")
-    lines.append("  3. Loop continues until LLM produces final response without tool calls")
-    lines.append("")
-    lines.append("  Example: 3 LLM calls = initial request + 2 tool-use cycles before final answer.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+        yield f"| {agent:<24} | {s['calls']:9} | {s['min']:6.2f}s | {s['max']:7.2f}s | {s['avg']:6.2f}s | {s['total']:7.1f}s |"
+    yield ""
+
+    yield "**Column Definitions:**"
+    yield "- **LLM Calls**: Number of round-trips to the Gemini API per invocation. Multiple calls occur due to the **agent loop pattern**:"
+    yield "  1. Agent sends query to LLM → LLM requests a tool (e.g., `query_graph`)"
+    yield "  2. Tool executes → result returned to LLM → LLM may request another tool"
+    yield "  3. Loop continues until LLM produces final response without tool calls"
+    yield ""
+    yield "  Example: 3 LLM calls = initial request + 2 tool-use cycles before final answer."
+    yield ""
+    yield "---"
+    yield ""
 
     # Response Time Distribution
-    lines.append("## Response Time Distribution")
-    lines.append("")
-    lines.append("| Duration Range | Count | Percentage | Cumulative | Assessment       |")
-    lines.append("|----------------|------:|-----------:|-----------:|------------------|")
+    yield "## Response Time Distribution"
+    yield ""
+    yield "| Duration Range | Count | Percentage | Cumulative | Assessment       |"
+    yield "|----------------|------:|-----------:|-----------:|------------------|"
     for d in distribution:
-        lines.append(f"| {d['range']:<14} | {d['count']:5} | {d['percentage']:10.1f}% | {d['cumulative']:10.1f}% | {d['assessment']:<16} |")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+        yield f"| {d['range']:<14} | {d['count']:5} | {d['percentage']:10.1f}% | {d['cumulative']:10.1f}% | {d['assessment']:<16} |"
+    yield ""
+    yield "---"
+    yield ""
 
     # Detailed Invocation Timing
-    lines.append("## Detailed Invocation Timing")
-    lines.append("")
-    lines.append("| #  | Time (UTC) | Invocation ID              | Agent(s)                | LLM Calls | Total    |  LLM    | Tools   | LLM % |")
-    lines.append("|---:|:-----------|:---------------------------|:------------------------|----------:|---------:|--------:|--------:|------:|")
+    yield "## Detailed Invocation Timing"
+    yield ""
+    yield "| #  | Time (UTC) | Invocation ID              | Agent(s)                | LLM Calls | Total    |  LLM    | Tools   | LLM % |"
+    yield "|---:|:-----------|:---------------------------|:------------------------|----------:|---------:|--------:|--------:|------:|"
 
     for i, inv in enumerate(invocations, 1):
-        time_str = inv.datetime.strftime('%H:%M:%S')
-        inv_id = f"`{inv.invocation_id[:24]}...`"
-        agent = inv.primary_agent
-        llm_calls = len(inv.llm_calls)
-        total = inv.total_duration
-        llm = inv.total_llm_time
-        tools = inv.tool_time
-        llm_pct = inv.llm_percentage
-
-        lines.append(f"| {i:2} | {time_str} | {inv_id:<26} | {agent:<23} | {llm_calls:9} | {total:8.2f}s | {llm:7.2f}s | {tools:7.2f}s | {llm_pct:5.0f}% |")
+        yield _DETAIL_ROW.format_map({
+            'i': i,
+            'time': _hms(inv.invocation_timestamp),
+            'inv_id': f"`{inv.invocation_id[:24]}...`",
+            'agent': inv.primary_agent,
+            'calls': len(inv.llm_calls),
+            'total': inv.total_duration,
+            'llm': inv.total_llm_time,
+            'tools': inv.tool_time,
+            'pct': inv.llm_percentage,
+        })
 
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    yield ""
+    yield "---"
+    yield ""
 
     # Critical Slow Queries
     slow_invocations = sorted([i for i in invocations if i.total_duration > 100],
                                key=lambda i: i.total_duration, reverse=True)
 
     if slow_invocations:
-        lines.append("## Critical Slow Queries (>100s)")
-        lines.append("")
-        lines.append("| Rank | Timestamp  | Invocation ID                          |   Total |     LLM |   Tools | User Query Summary                                              |")
-        lines.append("|-----:|:-----------|:---------------------------------------|--------:|--------:|--------:|:----------------------------------------------------------------|")
+        yield "## Critical Slow Queries (>100s)"
+        yield ""
+        yield "| Rank | Timestamp  | Invocation ID                          |   Total |     LLM |   Tools | User Query Summary                                              |"
+        yield "|-----:|:-----------|:---------------------------------------|--------:|--------:|--------:|:----------------------------------------------------------------|"
 
         for rank, inv in enumerate(slow_invocations[:10], 1):
-            time_str = inv.datetime.strftime('%H:%M:%S')
+            time_str = _hms(inv.invocation_timestamp)
             query = inv.user_query or "(query not extracted)"
             # Replace newlines with spaces to keep table intact
             query = ' '.join(query.split())
 
-            lines.append(f"| {rank:4} | {time_str}   | `{inv.invocation_id}` | {inv.total_duration:7.2f}s | {inv.total_llm_time:7.2f}s | {inv.tool_time:7.2f}s | {query} |")
+            yield f"| {rank:4} | {time_str}   | `{inv.invocation_id}` | {inv.total_duration:7.2f}s | {inv.total_llm_time:7.2f}s | {inv.tool_time:7.2f}s | {query} |"
 
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        yield ""
+        yield "---"
+        yield ""
 
     # LLM Call Breakdown (Sample)
-    lines.append("## LLM Call Breakdown (Sample of First 30 Calls)")
-    lines.append("")
-    lines.append("| Invocation       | Agent                   | Call # | Duration | Time Range (UTC)      |")
-    lines.append("|:-----------------|:------------------------|-------:|---------:|:----------------------|")
+    yield "## LLM Call Breakdown (Sample of First 30 Calls)"
+    yield ""
+    yield "| Invocation       | Agent                   | Call # | Duration | Time Range (UTC)      |"
+    yield "|:-----------------|:------------------------|-------:|---------:|:----------------------|"
 
     call_count = 0
     for inv in invocations:
-        for call in sorted(inv.llm_calls, key=lambda c: c.call_num):
-            if call_count >= 30:
-                break
-
+        # Only the lowest-numbered calls that still fit in the sample are
+        # needed, so select those instead of sorting the whole list.
+        remaining = 30 - call_count
+        for call in heapq.nsmallest(remaining, inv.llm_calls, key=lambda c: c.call_num):
             inv_short = f"`{inv.invocation_id[:12]}...`"
-            req_time = datetime.fromtimestamp(call.request_timestamp).strftime('%H:%M:%S')
-            resp_time = datetime.fromtimestamp(call.response_timestamp).strftime('%H:%M:%S')
+            req_time = _hms(call.request_timestamp)
+            resp_time = _hms(call.response_timestamp)
 
-            lines.append(f"| {inv_short:<16} | {call.agent_name:<23} | {call.call_num:6} | {call.duration:8.2f}s | {req_time} - {resp_time}   |")
+            yield f"| {inv_short:<16} | {call.agent_name:<23} | {call.call_num:6} | {call.duration:8.2f}s | {req_time} - {resp_time}   |"
             call_count += 1
 
         if call_count >= 30:
             break
 
-    lines.append("")
-    lines.append(f"*(Showing first 30 of {total_calls} calls)*")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    yield ""
+    yield f"*(Showing first 30 of {total_calls} calls)*"
+    yield ""
+    yield "---"
+    yield ""
 
     # Footer
-    lines.append(f"**Report generated:** {datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')}")
-    lines.append("**Analyzed by:** analyze_llm_traces.py")
-    lines.append(f"**Trace files:** {total_calls * 2}")  # request + response per call
-    lines.append(f"**Invocations:** {len(invocations)}")
-    lines.append("")
-
-    return '\n'.join(lines)
+    yield f"**Report generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}"
+    yield "**Analyzed by:** analyze_llm_traces.py"
+    yield f"**Trace files:** {total_calls * 2}"  # request + response per call
+    yield f"**Invocations:** {len(invocations)}"
 
 
 def get_trace_date(invocations: list[Invocation]) -> str:
-    """Extract date from trace timestamps in YYYYMMDD format."""
+    """Extract date from trace timestamps in YYYYMMDD format (UTC)."""
     if not invocations:
-        return datetime.now().strftime('%Y%m%d')
+        return datetime.now(timezone.utc).strftime('%Y%m%d')
 
     # Use the earliest invocation timestamp
     earliest = min(inv.invocation_timestamp for inv in invocations)
-    return datetime.fromtimestamp(earliest).strftime('%Y%m%d')
+    return datetime.fromtimestamp(earliest, tz=timezone.utc).strftime('%Y%m%d')
 
 
 def main():
@@ -536,14 +720,14 @@ def main():
         filename = f"MEDICAL_AGENT_QUERIES_{safe_namespace}_{trace_date}.md"
         output_path = args.output_dir / filename
 
-    # Generate report
-    report = generate_markdown_report(invocation_list, args.namespace, args.pod)
-
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w') as f:
-        f.write(report)
+    # Stream the report straight to disk through a large buffer instead
+    # of materializing it as one string first.
+    with open(output_path, 'w', buffering=1 << 20) as f:
+        f.writelines(line + '\n' for line in
+                     iter_report_lines(invocation_list, args.namespace, args.pod))
     print(f"Report written to {output_path}", file=sys.stderr)
 
     # Print the output path for use by calling scripts
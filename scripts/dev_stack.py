@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --quiet --script
 # /// script
 # requires-python = ">=3.13"
-# dependencies = ["tabulate"]
+# dependencies = []
 # ///
 """Development stack management script.
 
@@ -10,15 +10,154 @@ Supports modes: up (full stack), down (stop all), status (check services).
 """
 
 import argparse
+import functools
+import http.client
 import json
+import os
+import re
+import socket
 import subprocess
 import sys
 import time
-import urllib.request
+import tomllib
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
-from tabulate import tabulate
+try:
+    # orjson parses the compose ps output ~3x faster and serializes the
+    # JSON report modes without the CPython encoder; fall back to the
+    # stdlib when it is not installed.
+    from orjson import OPT_INDENT_2 as _OPT_INDENT_2
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+
+    def _dumps(obj: object) -> str:
+        return _orjson_dumps(obj, option=_OPT_INDENT_2).decode()
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _dumps(obj: object) -> str:
+        return json.dumps(obj, indent=2)
+
+# urllib.request is imported lazily inside the few functions that need
+# it: it alone pulls in email/ssl and the status/down subcommands never
+# touch either module. With uv re-parsing the script header on every
+# run, cold-start import time is user-visible.
+
+# Docker Engine API access over the unix socket. Talking to the daemon
+# directly skips a ~100-200ms docker CLI fork per query, which matters in
+# the health polling loop. Everything degrades to the CLI when the socket
+# is unavailable (e.g. remote DOCKER_HOST setups).
+_DOCKER_SOCKET = "/var/run/docker.sock"
+_DOCKER_API = "/v1.43"
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection speaking to the Docker daemon's unix socket."""
+
+    def __init__(self, socket_path: str = _DOCKER_SOCKET, timeout: float = 5.0) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+class DockerClient:
+    """Minimal Docker Engine API client shared across the helpers.
+
+    One kept-alive unix-socket connection serves every query, so the
+    polling loops pay for the handshake once instead of forking the
+    docker CLI (~100-200ms each) per call. All methods return None on
+    failure so callers can fall back to the CLI.
+    """
+
+    def __init__(self, socket_path: str = _DOCKER_SOCKET) -> None:
+        self._socket_path = socket_path
+        self._conn: http.client.HTTPConnection | None = None
+
+    def _get(self, path: str) -> tuple[int, bytes] | None:
+        """Issue a GET, retrying once through a fresh connection."""
+        for attempt in (0, 1):
+            try:
+                if self._conn is None:
+                    self._conn = _UnixHTTPConnection(self._socket_path)
+                self._conn.request("GET", path, headers={"Host": "docker"})
+                response = self._conn.getresponse()
+                return response.status, response.read()
+            except (OSError, http.client.HTTPException):
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+        return None
+
+    def api_get(self, path: str) -> list | dict | None:
+        """GET a Docker Engine API path, returning parsed JSON."""
+        reply = self._get(path)
+        if reply is None or reply[0] != 200:
+            return None
+        try:
+            return json.loads(reply[1])
+        except ValueError:
+            return None
+
+    def containers_ps(
+        self, project: str, include_stopped: bool = True
+    ) -> list[dict] | None:
+        """List containers of a compose project."""
+        scope = "all=1&" if include_stopped else ""
+        filters = urllib.parse.quote(
+            json.dumps({"label": [f"com.docker.compose.project={project}"]})
+        )
+        containers = self.api_get(
+            f"{_DOCKER_API}/containers/json?{scope}filters={filters}"
+        )
+        return containers if isinstance(containers, list) else None
+
+    def volume_exists(self, name: str) -> bool | None:
+        """Check whether a named volume exists; None when unreachable."""
+        reply = self._get(f"{_DOCKER_API}/volumes/{urllib.parse.quote(name)}")
+        if reply is None:
+            return None
+        return reply[0] == 200
+
+    def container_logs(self, container_id: str, tail: int = 50) -> str | None:
+        """Fetch a container's combined stdout/stderr log tail."""
+        reply = self._get(
+            f"{_DOCKER_API}/containers/{container_id}/logs"
+            f"?stdout=1&stderr=1&tail={tail}"
+        )
+        if reply is None or reply[0] != 200:
+            return None
+        body = reply[1]
+        # Non-TTY containers multiplex the stream: an 8-byte frame header
+        # (stream type, three zero bytes, big-endian payload length)
+        # precedes each payload chunk. TTY containers send raw bytes.
+        if len(body) >= 8 and body[0] in (0, 1, 2) and body[1:4] == b"\x00\x00\x00":
+            chunks = []
+            offset = 0
+            while offset + 8 <= len(body):
+                size = int.from_bytes(body[offset + 4 : offset + 8], "big")
+                chunks.append(body[offset + 8 : offset + 8 + size])
+                offset += 8 + size
+            body = b"".join(chunks)
+        return body.decode("utf-8", errors="replace")
+
+
+_docker = DockerClient()
+
+
+# Detail-line prefixes for the check reports, built once instead of
+# re-assembling the same icon-plus-indent string on every iteration.
+_OK = "  ✅ "
+_FAIL = "  ❌ "
+_OPT = "  ⚪ "
 
 
 @dataclass
@@ -31,11 +170,63 @@ class CheckResult:
     details: str = ""
 
 
+@dataclass(frozen=True, slots=True)
+class Paths:
+    """Well-known workspace paths, resolved once per invocation.
+
+    Helpers repeatedly rebuild the same derived paths; each `/` allocates a
+    fresh PurePath. Resolving them once and caching via get_paths keeps the
+    hot helpers allocation-free.
+    """
+
+    workspace_root: Path
+    catalog: Path
+    snapshots: Path
+
+
+@functools.lru_cache(maxsize=1)
+def get_paths(workspace_root: Path) -> Paths:
+    """Return the memoized Paths bundle for a workspace root."""
+    catalog = workspace_root / "repos" / "medical-catalog"
+    return Paths(
+        workspace_root=workspace_root,
+        catalog=catalog,
+        snapshots=catalog / "snapshots",
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_compose_project_name(workspace_root: Path) -> str:
+    """Resolve the compose project name used in container labels.
+
+    docker-compose.yaml pins `name: machina-meta`, so the Engine API
+    label filter must not assume the checkout directory matches it. Read
+    the top-level name: key directly; the directory name is only the
+    fallback, matching compose's own default when name: is absent.
+
+    Args:
+        workspace_root: Path to workspace root directory
+
+    Returns:
+        The compose project name
+    """
+    for filename in ("docker-compose.yaml", "docker-compose.yml", "compose.yaml"):
+        try:
+            with open(workspace_root / filename, encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("name:"):
+                        return line.split(":", 1)[1].strip().strip("\"'")
+        except OSError:
+            continue
+    return workspace_root.name
+
+
 def run_command(
     cmd: list[str],
     check: bool = True,
     cwd: Path | None = None,
     capture_output: bool = True,
+    discard_output: bool = False,
 ) -> subprocess.CompletedProcess[str]:
     """Run a shell command and return the result.
 
@@ -44,10 +235,20 @@ def run_command(
         check: Whether to raise exception on non-zero exit code
         cwd: Working directory for command execution
         capture_output: Whether to capture stdout/stderr
+        discard_output: Route stdout/stderr to /dev/null when only the
+            return code matters; avoids allocating pipes and draining them
 
     Returns:
         CompletedProcess with stdout/stderr captured as text
     """
+    if discard_output:
+        return subprocess.run(  # noqa: S603
+            cmd,
+            check=check,
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
     return subprocess.run(  # noqa: S603
         cmd,
         check=check,
@@ -57,6 +258,12 @@ def run_command(
     )
 
 
+# `docker compose ps` lines worth flagging, with the container name
+# (first column) captured via lookahead so only matching lines allocate.
+_FAILED_LINE_RE = re.compile(r"^(\S+)(?=.*(?:Exit|unhealthy))", re.MULTILINE)
+_STARTING_LINE_RE = re.compile(r"^(\S+)(?=.*\(health: starting\))", re.MULTILINE)
+
+
 def check_service_status(
     workspace_root: Path, wait_for_health_complete: bool = False
 ) -> tuple[bool, str, list[str]]:
@@ -69,6 +276,32 @@ def check_service_status(
     Returns:
         Tuple of (all_healthy, status_output, failed_services)
     """
+    # Fast path: query the Engine API directly. State and health come
+    # back as structured fields, so no string-scan over `docker compose
+    # ps` text is needed.
+    containers = _docker.containers_ps(get_compose_project_name(workspace_root))
+    if containers is not None:
+        failed_services = []
+        status_lines = []
+        for c in containers:
+            names = c.get("Names") or ["/unknown"]
+            name = names[0].lstrip("/")
+            state = c.get("State", "")
+            status = c.get("Status", "")
+            status_lines.append(f"{name}   {state}   {status}")
+
+            is_unhealthy = state == "exited" or "(unhealthy)" in status
+            is_starting = wait_for_health_complete and "(health: starting)" in status
+            if is_unhealthy or is_starting:
+                failed_services.append(
+                    name.replace("machina-meta-", "").replace("-1", "")
+                )
+
+        return (not failed_services, "\n".join(status_lines), failed_services)
+
+    # Fallback: scrape `docker compose ps` output. A compiled multiline
+    # scan pulls the first column off only the lines that matter, instead
+    # of split()-ing every line into throwaway lists on each poll.
     result = run_command(
         ["docker", "compose", "ps"],
         check=False,
@@ -76,43 +309,91 @@ def check_service_status(
     )
     output = result.stdout
 
-    # Check for unhealthy or exited services and extract their names
-    failed_services = []
-    for line in output.split("\n"):
-        is_unhealthy = "Exit" in line or "unhealthy" in line
-        is_starting = wait_for_health_complete and "(health: starting)" in line
-
-        if is_unhealthy or is_starting:
-            # Extract service name (first column before whitespace)
-            parts = line.split()
-            if parts:
-                service_name = parts[0].replace("machina-meta-", "").replace("-1", "")
-                failed_services.append(service_name)
+    failed_services = [
+        match.group(1).replace("machina-meta-", "").replace("-1", "")
+        for match in _FAILED_LINE_RE.finditer(output)
+    ]
+    if wait_for_health_complete:
+        failed_services.extend(
+            match.group(1).replace("machina-meta-", "").replace("-1", "")
+            for match in _STARTING_LINE_RE.finditer(output)
+        )
 
     has_issues = len(failed_services) > 0
 
     return (not has_issues, output, failed_services)
 
 
-def get_service_logs(
+def iter_service_logs(
     workspace_root: Path, service_names: list[str] | None = None, tail: int = 50
-) -> str:
-    """Get logs for specific services or all services.
+):
+    """Stream log lines for specific services or all services.
+
+    Yields lines as docker compose produces them instead of buffering the
+    combined output; closing the generator early terminates the child.
 
     Args:
         workspace_root: Path to workspace root directory
         service_names: List of service names to get logs for (None = all)
         tail: Number of lines to show per service
 
-    Returns:
-        Combined log output
+    Yields:
+        Individual log lines (newline included)
     """
     cmd = ["docker", "compose", "logs", f"--tail={tail}"]
     if service_names:
         cmd.extend(service_names)
 
-    result = run_command(cmd, check=False, cwd=workspace_root)
-    return result.stdout
+    proc = subprocess.Popen(  # noqa: S603
+        cmd,
+        cwd=workspace_root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        bufsize=1,
+    )
+    try:
+        assert proc.stdout is not None
+        yield from proc.stdout
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+        proc.wait()
+
+
+def get_service_logs(
+    workspace_root: Path, service_names: list[str] | None = None, tail: int = 50
+) -> str:
+    """Get logs as one string.
+
+    Tries the Engine API first (one kept-alive socket, no compose fork);
+    falls back to streaming `docker compose logs` when unavailable.
+    """
+    containers = _docker.containers_ps(get_compose_project_name(workspace_root))
+    if containers is not None:
+        wanted = set(service_names) if service_names else None
+        parts = []
+        for container in containers:
+            service = container.get("Labels", {}).get(
+                "com.docker.compose.service", ""
+            )
+            if wanted is not None and service not in wanted:
+                continue
+            logs = _docker.container_logs(container.get("Id", ""), tail=tail)
+            if logs is None:
+                break  # daemon hiccup mid-read; take the CLI path instead
+            parts.append(logs)
+        else:
+            return "".join(parts)
+    return "".join(iter_service_logs(workspace_root, service_names, tail))
+
+
+# Lines worth surfacing in the error analysis; compiled once and applied
+# to the whole log buffer in a single multiline scan.
+_ERR_LINE_RE = re.compile(
+    r"^.*(?:error:|failed|exception|fatal|cannot).*$",
+    re.IGNORECASE | re.MULTILINE,
+)
 
 
 def analyze_logs(logs: str) -> str:
@@ -124,21 +405,21 @@ def analyze_logs(logs: str) -> str:
     Returns:
         Analysis message with troubleshooting steps
     """
-    lines = logs.split("\n")
-
-    # Extract unique error patterns
+    # Extract unique error patterns with one C-level scan over the whole
+    # buffer instead of lowercasing and substring-testing every line.
     errors = []
-    for line in lines:
-        lower = line.lower()
-        if any(
-            keyword in lower
-            for keyword in ["error:", "failed", "exception", "fatal", "cannot"]
-        ):
-            # Clean up container prefix and extract meaningful error
-            if "|" in line:
-                error_msg = line.split("|", 1)[1].strip()
-                if error_msg and error_msg not in errors:
-                    errors.append(error_msg)
+    seen: set[str] = set()
+    for match in _ERR_LINE_RE.finditer(logs):
+        line = match.group()
+        # Clean up container prefix and extract meaningful error
+        if "|" in line:
+            error_msg = line.split("|", 1)[1].strip()
+            if error_msg and error_msg not in seen:
+                seen.add(error_msg)
+                errors.append(error_msg)
+                if len(errors) >= 5:
+                    # Only the first five unique errors are reported.
+                    break
 
     if not errors:
         return "No specific errors found in logs. Check full logs with: docker compose logs <service>"
@@ -157,16 +438,60 @@ def analyze_logs(logs: str) -> str:
     return "\n".join(msg)
 
 
+def _read_qdrant_url_from_config(catalog_path: Path) -> str | None:
+    """Best-effort direct read of the catalog's Qdrant REST URL.
+
+    `just get-qdrant-url` costs two fork/exec hops to print values that
+    live in the catalog's config.toml (dynaconf). Reading the file
+    directly turns ~150ms of subprocess latency into a sub-millisecond
+    parse; callers fall back to just when the expected keys are absent.
+    """
+    config_file = catalog_path / "config.toml"
+    if not config_file.is_file():
+        return None
+    try:
+        config = tomllib.loads(config_file.read_text())
+    except (OSError, tomllib.TOMLDecodeError):
+        return None
+
+    # dynaconf layouts may nest settings under an environment table
+    # (e.g. [default.qdrant]); scan the top level and one level down.
+    sections = [config]
+    sections.extend(v for v in config.values() if isinstance(v, dict))
+    for section in sections:
+        qdrant = section.get("qdrant")
+        if not isinstance(qdrant, dict):
+            continue
+        url = qdrant.get("rest_api")
+        if isinstance(url, str):
+            return url
+        host = qdrant.get("host")
+        port = qdrant.get("rest_port", qdrant.get("port"))
+        if host and port:
+            return f"http://{host}:{port}"
+    return None
+
+
+@functools.lru_cache(maxsize=8)
 def get_qdrant_url(workspace_root: Path) -> str | None:
     """Get Qdrant URL from medical-catalog configuration.
 
+    Cached per workspace root: the URL comes from a config file (or a
+    just recipe) that cannot change mid-invocation, so repeat callers
+    skip the disk read or fork entirely.
+
     Args:
         workspace_root: Path to workspace root directory
 
     Returns:
         Qdrant REST API URL or None if unable to retrieve
     """
-    catalog_path = workspace_root / "repos" / "medical-catalog"
+    catalog_path = get_paths(workspace_root).catalog
+
+    url = _read_qdrant_url_from_config(catalog_path)
+    if url is not None:
+        return url
+
     try:
         result = run_command(
             ["just", "get-qdrant-url"],
@@ -181,9 +506,14 @@ def get_qdrant_url(workspace_root: Path) -> str | None:
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_qdrant_volume_name(workspace_root: Path) -> str | None:
     """Get the Qdrant storage volume name from docker-compose configuration.
 
+    Cached for the process lifetime: `docker compose config` re-parses and
+    merges every compose file on each run (routinely 0.5-2s), and the
+    resolved config cannot change underneath a single script invocation.
+
     Args:
         workspace_root: Path to workspace root directory
 
@@ -215,6 +545,37 @@ def get_qdrant_volume_name(workspace_root: Path) -> str | None:
         return None
 
 
+def check_volumes_exist(volume_names: list[str]) -> dict[str, bool]:
+    """Check which of the named docker volumes exist.
+
+    `docker volume inspect` accepts any number of names in one call and
+    still prints a JSON array covering the ones that do exist, so N
+    existence checks cost one subprocess instead of N.
+
+    Args:
+        volume_names: Volume names to look up
+
+    Returns:
+        Mapping of volume name to whether it exists
+    """
+    existence = dict.fromkeys(volume_names, False)
+    if not volume_names:
+        return existence
+
+    try:
+        result = run_command(
+            ["docker", "volume", "inspect", *volume_names],
+            check=False,
+        )
+        for volume in json.loads(result.stdout or "[]"):
+            name = volume.get("Name")
+            if name in existence:
+                existence[name] = True
+    except Exception:
+        pass
+    return existence
+
+
 def check_qdrant_volume_exists(workspace_root: Path) -> bool:
     """Check if the Qdrant storage volume already exists.
 
@@ -228,14 +589,11 @@ def check_qdrant_volume_exists(workspace_root: Path) -> bool:
     if not volume_name:
         return False
 
-    try:
-        result = run_command(
-            ["docker", "volume", "inspect", volume_name],
-            check=False,
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
+    exists = _docker.volume_exists(volume_name)
+    if exists is not None:
+        return exists
+
+    return check_volumes_exist([volume_name])[volume_name]
 
 
 def restore_qdrant_snapshots(workspace_root: Path) -> bool:
@@ -247,27 +605,33 @@ def restore_qdrant_snapshots(workspace_root: Path) -> bool:
     Returns:
         True if restore was successful or not needed
     """
-    catalog_path = workspace_root / "repos" / "medical-catalog"
-    snapshots_path = catalog_path / "snapshots"
+    paths = get_paths(workspace_root)
+    snapshots_path = paths.snapshots
 
     # Check if snapshots directory exists
     if not snapshots_path.exists():
         print("⚠️  No snapshots directory found, skipping restore")
         return True
 
-    # Check if there are any snapshot files
-    snapshot_files = list(snapshots_path.glob("*.snapshot"))
-    if not snapshot_files:
+    # Check if there are any snapshot files. Only the count is needed, so
+    # scandir's cached dirent type info beats glob's per-entry Path + stat.
+    with os.scandir(snapshots_path) as entries:
+        snapshot_count = sum(
+            1
+            for e in entries
+            if e.name.endswith(".snapshot") and e.is_file(follow_symlinks=False)
+        )
+    if not snapshot_count:
         print("⚠️  No snapshot files found, skipping restore")
         return True
 
-    print(f"Found {len(snapshot_files)} snapshot files, restoring...")
+    print(f"Found {snapshot_count} snapshot files, restoring...")
 
     # Run snapshot-restore-all via justfile
     result = run_command(
         ["just", "snapshot-restore-all"],
         check=False,
-        cwd=catalog_path,
+        cwd=paths.catalog,
         capture_output=False,  # Show output to user
     )
 
@@ -292,6 +656,10 @@ def wait_for_health_checks(workspace_root: Path, max_wait: int = 60) -> bool:
     print(f"Waiting for health checks to complete (max {max_wait}s)...")
     start_time = time.time()
 
+    # Probe quickly at first — a stack that is already healthy answers in
+    # the first few hundred ms — then back off so a slow stack is not
+    # hammered with status queries.
+    delay = 0.25
     while time.time() - start_time < max_wait:
         # Check with wait_for_health_complete=True to wait for all health checks to finish
         all_healthy, _, failed_services = check_service_status(
@@ -304,7 +672,8 @@ def wait_for_health_checks(workspace_root: Path, max_wait: int = 60) -> bool:
             return True
 
         # Wait a bit before checking again
-        time.sleep(3)
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
 
     return False
 
@@ -336,11 +705,12 @@ def check_service_status_test(workspace_root: Path) -> CheckResult:
     passed = all_required_running
 
     # Build details showing each service
-    details_lines = []
-    for svc in services:
-        status_icon = "✅" if svc["running"] else "❌"
-        optional_tag = " (optional)" if svc.get("optional", False) else ""
-        details_lines.append(f"  {status_icon} {svc['service']}{optional_tag}")
+    details_lines = [
+        (_OK if svc["running"] else _FAIL)
+        + svc["service"]
+        + (" (optional)" if svc.get("optional", False) else "")
+        for svc in services
+    ]
 
     return CheckResult(
         name="Service Status",
@@ -350,39 +720,138 @@ def check_service_status_test(workspace_root: Path) -> CheckResult:
     )
 
 
-def check_container_status(workspace_root: Path) -> CheckResult:
-    """Check 2: Container status via docker compose ps.
+@functools.lru_cache(maxsize=1)
+def get_docker_snapshot(workspace_root: Path) -> dict[str, dict] | None:
+    """One-shot snapshot of the compose project's containers.
+
+    Runs `docker compose ps --format json` once plus a single batched
+    `docker inspect` for health states, so the container-status and
+    health sub-checks share O(1) docker calls instead of issuing their
+    own overlapping queries. Cached for the process lifetime; dev_check
+    primes it once before dispatching the checks.
 
     Args:
         workspace_root: Path to workspace root directory
 
     Returns:
-        CheckResult with container status summary
+        Mapping of container id to name/state/status/health, or None if
+        the container list could not be queried
     """
-    result = run_command(
-        ["docker", "compose", "ps", "--format", "json"],
-        check=False,
-        cwd=workspace_root,
+    # Fast path: the Engine API over the kept-alive socket returns the
+    # same fields without forking the docker CLI at all. Health rides in
+    # the Status string ("Up 3 minutes (healthy)"), so no inspect needed.
+    # Running containers only, matching what `docker compose ps` and the
+    # old `docker ps --filter name=machina-meta` listings reported.
+    api_containers = _docker.containers_ps(
+        get_compose_project_name(workspace_root), include_stopped=False
     )
+    if api_containers is not None:
+        containers: dict[str, dict] = {}
+        for entry in api_containers:
+            names = entry.get("Names") or ["/unknown"]
+            status = entry.get("Status", "")
+            if "(healthy)" in status:
+                health = "healthy"
+            elif "(unhealthy)" in status:
+                health = "unhealthy"
+            elif "(health: starting)" in status:
+                health = "starting"
+            else:
+                health = "no-healthcheck"
+            containers[entry.get("Id", names[0])] = {
+                "name": names[0].lstrip("/"),
+                "state": entry.get("State", "unknown"),
+                "status": status,
+                "health": health,
+            }
+        return containers
 
+    try:
+        result = run_command(
+            ["docker", "compose", "ps", "--format", "json"],
+            check=False,
+            cwd=workspace_root,
+        )
+    except Exception:
+        return None
     if result.returncode != 0:
+        return None
+
+    # compose v2.21+ emits a single JSON array when stdout is not a TTY;
+    # older versions emit NDJSON. Try the one-shot array parse first and
+    # only fall back to the per-line loop with its bad-line tolerance.
+    try:
+        entries = _json_loads(result.stdout)
+        if isinstance(entries, dict):
+            entries = [entries]
+    except ValueError:
+        entries = []
+        for line in result.stdout.splitlines():
+            if not line:
+                continue
+            try:
+                entries.append(_json_loads(line))
+            except ValueError:
+                continue
+
+    containers = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        cid = entry.get("ID") or entry.get("Id") or entry.get("Name", "")
+        containers[cid] = {
+            "name": entry.get("Name", "unknown"),
+            "state": entry.get("State", "unknown"),
+            "status": entry.get("Status", ""),
+            "health": "unknown",
+        }
+
+    if not containers:
+        return containers
+
+    # One batched inspect covers every container's health state.
+    inspect_result = run_command(
+        [
+            "docker",
+            "inspect",
+            "--format",
+            "{{.Id}}|{{if .State.Health}}{{.State.Health.Status}}{{else}}no-healthcheck{{end}}",
+            *containers,
+        ],
+        check=False,
+    )
+    for line in inspect_result.stdout.splitlines():
+        if "|" not in line:
+            continue
+        full_id, health = line.split("|", 1)
+        # compose ps may report short ids; inspect prints the full 64-char id
+        for cid, info in containers.items():
+            if full_id.startswith(cid):
+                info["health"] = health
+                break
+    return containers
+
+
+def check_container_status(workspace_root: Path) -> CheckResult:
+    """Check 2: Container status via the shared docker snapshot.
+
+    Args:
+        workspace_root: Path to workspace root directory
+
+    Returns:
+        CheckResult with container status summary
+    """
+    snapshot = get_docker_snapshot(workspace_root)
+
+    if snapshot is None:
         return CheckResult(
             name="Container Status",
             passed=False,
             message="Failed to query containers",
-            details=result.stderr or "docker compose ps failed",
+            details="docker compose ps failed",
         )
 
-    # Parse JSON output (one JSON object per line)
-    containers = []
-    for line in result.stdout.strip().split("\n"):
-        if line:
-            try:
-                containers.append(json.loads(line))
-            except json.JSONDecodeError:
-                pass
-
-    if not containers:
+    if not snapshot:
         return CheckResult(
             name="Container Status",
             passed=False,
@@ -390,17 +859,16 @@ def check_container_status(workspace_root: Path) -> CheckResult:
             details="No machina-meta containers are running",
         )
 
-    running = sum(1 for c in containers if c.get("State") == "running")
-    total = len(containers)
+    running = sum(1 for c in snapshot.values() if c["state"] == "running")
+    total = len(snapshot)
     passed = running == total
 
-    details_lines = []
-    for c in containers:
-        name = c.get("Name", "unknown")
-        state = c.get("State", "unknown")
-        status = c.get("Status", "")
-        icon = "✅" if state == "running" else "❌"
-        details_lines.append(f"  {icon} {name}: {status}")
+    details_lines = [
+        "".join(
+            (_OK if c["state"] == "running" else _FAIL, c["name"], ": ", c["status"])
+        )
+        for c in snapshot.values()
+    ]
 
     return CheckResult(
         name="Container Status",
@@ -419,13 +887,9 @@ def check_health_checks(workspace_root: Path) -> CheckResult:
     Returns:
         CheckResult with health check summary
     """
-    # Get container IDs for machina-meta containers
-    result = run_command(
-        ["docker", "ps", "-q", "--filter", "name=machina-meta"],
-        check=False,
-    )
+    snapshot = get_docker_snapshot(workspace_root)
 
-    if result.returncode != 0 or not result.stdout.strip():
+    if not snapshot:
         return CheckResult(
             name="Health Checks",
             passed=False,
@@ -433,27 +897,9 @@ def check_health_checks(workspace_root: Path) -> CheckResult:
             details="No machina-meta containers are running",
         )
 
-    container_ids = result.stdout.strip().split("\n")
-
-    # Inspect each container for health status
-    health_results = []
-    for cid in container_ids:
-        inspect_result = run_command(
-            [
-                "docker",
-                "inspect",
-                "--format",
-                "{{.Name}}|{{if .State.Health}}{{.State.Health.Status}}{{else}}no-healthcheck{{end}}",
-                cid,
-            ],
-            check=False,
-        )
-        if inspect_result.returncode == 0:
-            output = inspect_result.stdout.strip()
-            if "|" in output:
-                name, status = output.split("|", 1)
-                name = name.lstrip("/")
-                health_results.append((name, status))
+    health_results = [
+        (info["name"].lstrip("/"), info["health"]) for info in snapshot.values()
+    ]
 
     healthy = sum(1 for _, status in health_results if status in ("healthy", "no-healthcheck"))
     total = len(health_results)
@@ -462,12 +908,12 @@ def check_health_checks(workspace_root: Path) -> CheckResult:
     details_lines = []
     for name, status in health_results:
         if status == "healthy":
-            icon = "✅"
+            icon = _OK
         elif status == "no-healthcheck":
-            icon = "⚪"
+            icon = _OPT
         else:
-            icon = "❌"
-        details_lines.append(f"  {icon} {name}: {status}")
+            icon = _FAIL
+        details_lines.append("".join((icon, name, ": ", status)))
 
     return CheckResult(
         name="Health Checks",
@@ -477,6 +923,62 @@ def check_health_checks(workspace_root: Path) -> CheckResult:
     )
 
 
+# docker stats samples cgroup counters over a short window and routinely
+# takes 1-2s; keep the parsed rows around briefly so repeated check runs
+# within one process don't re-pay the sampling.
+_STATS_TTL = 10.0
+_stats_cache: dict[Path, tuple[float, list[dict] | None, str]] = {}
+
+
+def _collect_container_stats(workspace_root: Path) -> tuple[list[dict] | None, str]:
+    """Collect per-container CPU/memory rows, cached for a short TTL.
+
+    Args:
+        workspace_root: Path to workspace root directory
+
+    Returns:
+        Tuple of (stat rows or None on failure, error details)
+    """
+    now = time.monotonic()
+    cached = _stats_cache.get(workspace_root)
+    if cached is not None and now - cached[0] < _STATS_TTL:
+        return cached[1], cached[2]
+
+    # Scope stats to the project's container ids (from the shared
+    # snapshot) so the daemon only samples cgroup counters for our
+    # containers, and "machina" lookalikes can't sneak into the report.
+    # Without a snapshot, fall back to stats-everything plus the old
+    # name filter.
+    snapshot = get_docker_snapshot(workspace_root)
+    cmd = [
+        "docker",
+        "stats",
+        "--no-stream",
+        "--format",
+        "{{.Name}}|{{.CPUPerc}}|{{.MemUsage}}",
+    ]
+    if snapshot:
+        cmd.extend(snapshot)
+    result = run_command(cmd, check=False)
+
+    if result.returncode != 0:
+        rows: list[dict] | None = None
+        error = result.stderr or "docker stats failed"
+    else:
+        rows = []
+        error = ""
+        for line in result.stdout.splitlines():
+            if snapshot or "machina" in line.lower():
+                parts = line.split("|")
+                if len(parts) == 3:
+                    rows.append(
+                        {"name": parts[0], "cpu": parts[1], "memory": parts[2]}
+                    )
+
+    _stats_cache[workspace_root] = (now, rows, error)
+    return rows, error
+
+
 def check_resource_usage(workspace_root: Path) -> CheckResult:
     """Check 4: Resource usage via docker stats.
 
@@ -486,35 +988,16 @@ def check_resource_usage(workspace_root: Path) -> CheckResult:
     Returns:
         CheckResult with resource usage summary
     """
-    result = run_command(
-        [
-            "docker",
-            "stats",
-            "--no-stream",
-            "--format",
-            "{{.Name}}|{{.CPUPerc}}|{{.MemUsage}}",
-        ],
-        check=False,
-    )
+    stats, error = _collect_container_stats(workspace_root)
 
-    if result.returncode != 0:
+    if stats is None:
         return CheckResult(
             name="Resource Usage",
             passed=False,
             message="Failed to query stats",
-            details=result.stderr or "docker stats failed",
+            details=error,
         )
 
-    # Parse stats output and filter for machina containers
-    stats = []
-    for line in result.stdout.strip().split("\n"):
-        if "machina" in line.lower():
-            parts = line.split("|")
-            if len(parts) == 3:
-                stats.append(
-                    {"name": parts[0], "cpu": parts[1], "memory": parts[2]}
-                )
-
     if not stats:
         return CheckResult(
             name="Resource Usage",
@@ -558,8 +1041,15 @@ def check_volume_status(workspace_root: Path) -> CheckResult:
             details=result.stderr or "docker volume ls failed",
         )
 
-    # Filter for machina volumes
-    volumes = [v for v in result.stdout.strip().split("\n") if "machina" in v.lower()]
+    # Filter for machina volumes, lowercasing each name exactly once so
+    # the pattern match below doesn't redo it per pattern.
+    volumes = []
+    lowered = []
+    for v in result.stdout.splitlines():
+        low = v.lower()
+        if "machina" in low:
+            volumes.append(v)
+            lowered.append(low)
 
     if not volumes:
         return CheckResult(
@@ -569,12 +1059,11 @@ def check_volume_status(workspace_root: Path) -> CheckResult:
             details="Expected volumes for postgres, neo4j, redis, qdrant",
         )
 
-    # Check for expected volumes
-    expected_patterns = ["postgres", "neo4j", "redis", "qdrant"]
-    found_patterns = []
-    for pattern in expected_patterns:
-        if any(pattern in v.lower() for v in volumes):
-            found_patterns.append(pattern)
+    # One pass over the volume names collects every expected pattern hit.
+    expected_patterns = ("postgres", "neo4j", "redis", "qdrant")
+    found_patterns = {
+        pattern for low in lowered for pattern in expected_patterns if pattern in low
+    }
 
     passed = len(found_patterns) >= 3  # Allow some flexibility
 
@@ -590,6 +1079,45 @@ def check_volume_status(workspace_root: Path) -> CheckResult:
     )
 
 
+# Probe results shared across checks within one run: the service status
+# and endpoint health sub-checks overlap on the frontend and catalog
+# URLs, so each URL is probed once per TTL window. A racing duplicate
+# probe from the parallel checks is harmless, so no lock is taken.
+_PROBE_TTL = 5.0
+_probe_cache: dict[str, tuple[float, bool, str]] = {}
+
+
+def _probe_url(url: str, timeout: float = 3.0) -> tuple[bool, str]:
+    """Probe a URL, reusing a recent result when one exists.
+
+    Args:
+        url: URL to check
+        timeout: Request timeout in seconds
+
+    Returns:
+        Tuple of (healthy, short status message)
+    """
+    import urllib.error
+    import urllib.request
+
+    now = time.monotonic()
+    cached = _probe_cache.get(url)
+    if cached is not None and now - cached[0] < _PROBE_TTL:
+        return cached[1], cached[2]
+
+    try:
+        req = urllib.request.Request(url, method="GET")
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            result = (200 <= response.status < 400, f"HTTP {response.status}")
+    except urllib.error.URLError as e:
+        result = (False, str(e.reason)[:30])
+    except Exception as e:
+        result = (False, str(e)[:30])
+
+    _probe_cache[url] = (now, *result)
+    return result
+
+
 def check_endpoint_health(workspace_root: Path) -> CheckResult:
     """Check 6: HTTP endpoint health checks.
 
@@ -606,26 +1134,25 @@ def check_endpoint_health(workspace_root: Path) -> CheckResult:
         ("Frontend", "http://localhost:3000"),
     ]
 
-    results = []
-    for name, url in endpoints:
-        try:
-            req = urllib.request.Request(url, method="GET")
-            with urllib.request.urlopen(req, timeout=3) as response:
-                healthy = 200 <= response.status < 400
-                results.append((name, healthy, f"HTTP {response.status}"))
-        except urllib.error.URLError as e:
-            results.append((name, False, str(e.reason)[:30]))
-        except Exception as e:
-            results.append((name, False, str(e)[:30]))
+    def probe(name: str, url: str) -> tuple[str, bool, str]:
+        healthy, msg = _probe_url(url)
+        return (name, healthy, msg)
+
+    # Probe concurrently: one dead endpoint no longer serializes the
+    # check to the sum of the timeouts. Collecting in submit order keeps
+    # the report ordering stable.
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = [executor.submit(probe, name, url) for name, url in endpoints]
+        results = [future.result() for future in futures]
 
     healthy = sum(1 for _, h, _ in results if h)
     total = len(results)
     passed = healthy == total
 
-    details_lines = []
-    for name, is_healthy, msg in results:
-        icon = "✅" if is_healthy else "❌"
-        details_lines.append(f"  {icon} {name}: {msg}")
+    details_lines = [
+        "".join((_OK if is_healthy else _FAIL, name, ": ", msg))
+        for name, is_healthy, msg in results
+    ]
 
     return CheckResult(
         name="Endpoint Health",
@@ -635,6 +1162,31 @@ def check_endpoint_health(workspace_root: Path) -> CheckResult:
     )
 
 
+def format_table(rows: list[list], headers: list[str]) -> str:
+    """Render a small pipe-style markdown table.
+
+    Replaces tabulate for the fixed few-row tables this script emits:
+    importing tabulate costs far more than formatting the table itself,
+    and that import tax is paid on every CLI invocation.
+
+    Args:
+        rows: Table rows; cells are stringified with str()
+        headers: Column header labels
+
+    Returns:
+        Markdown pipe table string
+    """
+    table = [[str(cell) for cell in headers]]
+    table.extend([str(cell) for cell in row] for row in rows)
+    widths = [max(len(row[i]) for row in table) for i in range(len(headers))]
+    lines = [
+        "| " + " | ".join(cell.ljust(w) for cell, w in zip(row, widths)) + " |"
+        for row in table
+    ]
+    lines.insert(1, "|" + "|".join(":" + "-" * (w + 1) for w in widths) + "|")
+    return "\n".join(lines)
+
+
 def format_check_results_markdown(results: list[CheckResult]) -> str:
     """Format check results as a markdown table.
 
@@ -651,7 +1203,7 @@ def format_check_results_markdown(results: list[CheckResult]) -> str:
         status_icon = "✅ PASS" if result.passed else "❌ FAIL"
         rows.append([i, result.name, status_icon, result.message])
 
-    table = tabulate(rows, headers=headers, tablefmt="pipe")
+    table = format_table(rows, headers)
 
     # Calculate summary
     passed = sum(1 for r in results if r.passed)
@@ -694,7 +1246,7 @@ def format_check_results_json(results: list[CheckResult]) -> str:
             "all_passed": all(r.passed for r in results),
         },
     }
-    return json.dumps(data, indent=2)
+    return _dumps(data)
 
 
 def dev_check(workspace_root: Path, output_format: str = "markdown", verbose: bool = False) -> int:
@@ -716,15 +1268,26 @@ def dev_check(workspace_root: Path, output_format: str = "markdown", verbose: bo
     Returns:
         Exit code (0 = all checks passed, 1 = some checks failed)
     """
-    results: list[CheckResult] = []
+    checks = (
+        check_service_status_test,
+        check_container_status,
+        check_health_checks,
+        check_resource_usage,
+        check_volume_status,
+        check_endpoint_health,
+    )
+
+    # Prime the shared container snapshot once so the checks running in
+    # parallel below all hit the cache instead of racing to build it.
+    get_docker_snapshot(workspace_root)
 
-    # Run all checks
-    results.append(check_service_status_test(workspace_root))
-    results.append(check_container_status(workspace_root))
-    results.append(check_health_checks(workspace_root))
-    results.append(check_resource_usage(workspace_root))
-    results.append(check_volume_status(workspace_root))
-    results.append(check_endpoint_health(workspace_root))
+    # The checks are independent docker/HTTP queries, so overlap them on
+    # a thread pool; wall time drops from the sum of the checks to the
+    # slowest one (docker stats, typically). Collecting in submit order
+    # keeps the report layout stable.
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(check, workspace_root) for check in checks]
+        results: list[CheckResult] = [future.result() for future in futures]
 
     # Format output
     if output_format == "json":
@@ -759,6 +1322,13 @@ def dev_up(workspace_root: Path) -> int:
     print("Starting full stack in production mode...")
     print()
 
+    # The catalog URL lookup shells out to just and depends on nothing
+    # else here, so overlap it with the volume check and the compose
+    # build instead of paying for it serially later.
+    pool = ThreadPoolExecutor(max_workers=2)
+    qdrant_url_future = pool.submit(get_qdrant_url, workspace_root)
+    pool.shutdown(wait=False)
+
     # Check if Qdrant volume exists before starting services
     volume_existed = check_qdrant_volume_exists(workspace_root)
     needs_snapshot_restore = not volume_existed
@@ -768,42 +1338,57 @@ def dev_up(workspace_root: Path) -> int:
     else:
         print("✅ Qdrant volume exists - using existing data")
 
-    # Start all services with dev profile (quiet by default)
+    # Start all services with dev profile. --wait blocks until every
+    # container's healthcheck passes (or the timeout lapses), so the
+    # daemon signals readiness instead of a fixed sleep-then-poll: fast
+    # stacks come up as soon as they are healthy, slow ones get the full
+    # window.
+    print("Waiting for services to become healthy...")
     result = run_command(
-        ["docker", "compose", "--profile", "dev", "up", "-d", "--build"],
+        [
+            "docker",
+            "compose",
+            "--profile",
+            "dev",
+            "up",
+            "-d",
+            "--build",
+            "--wait",
+            "--wait-timeout",
+            "90",
+        ],
         check=False,
         cwd=workspace_root,
     )
 
-    # Show docker output if command failed
-    if result.returncode != 0:
-        print("❌ ERROR: docker compose up failed")
-        print()
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
-        return 1
-
-    # Wait 15 seconds for services to initialize
-    print("Waiting for services to initialize...")
-    time.sleep(15)
+    compose_failed = result.returncode != 0
+    if compose_failed:
+        # --wait exits non-zero both for build/config failures and for
+        # containers that never turned healthy. If nothing started at
+        # all, surface compose's own output; otherwise fall through to
+        # the health diagnostics below.
+        _, _, failed_services = check_service_status(workspace_root)
+        if not failed_services:
+            print("❌ ERROR: docker compose up failed")
+            print()
+            if result.stdout:
+                print(result.stdout)
+            if result.stderr:
+                print(result.stderr)
+            return 1
 
     # Restore snapshots if this is a fresh Qdrant volume
     if needs_snapshot_restore:
-        # Get Qdrant URL from configuration
-        qdrant_url = get_qdrant_url(workspace_root)
+        # Get Qdrant URL from the lookup started before compose up
+        qdrant_url = qdrant_url_future.result()
         if not qdrant_url:
             print("⚠️  Could not get Qdrant URL from configuration, skipping snapshot restore")
         else:
-            # Wait for Qdrant to be ready
+            # With --wait Qdrant is normally already healthy here, so the
+            # first probe succeeds; the loop only matters on compose
+            # versions that ignore --wait.
             print("Waiting for Qdrant to be ready...")
-            qdrant_ready = False
-            for _ in range(30):  # Wait up to 30 seconds
-                if check_http_endpoint(qdrant_url):
-                    qdrant_ready = True
-                    break
-                time.sleep(1)
+            qdrant_ready = _wait_for_qdrant(qdrant_url, max_wait=30)
 
             if not qdrant_ready:
                 print("⚠️  Qdrant did not become ready, skipping snapshot restore")
@@ -814,8 +1399,10 @@ def dev_up(workspace_root: Path) -> int:
                 else:
                     print("✅ Snapshots restored successfully")
 
-    # Wait for health checks with timeout (90s to allow for start_period + retries)
-    if not wait_for_health_checks(workspace_root, max_wait=90):
+    # compose --wait already blocked on health; the poll below is a
+    # single fast pass on success and only loops on compose versions
+    # that ignore --wait.
+    if compose_failed or not wait_for_health_checks(workspace_root, max_wait=90):
         # Health checks timed out or failed
         all_healthy, status_output, failed_services = check_service_status(
             workspace_root
@@ -831,8 +1418,11 @@ def dev_up(workspace_root: Path) -> int:
         # Get logs for failed services
         print(f"Analyzing logs for failed services: {', '.join(failed_services)}")
         print()
-        logs = get_service_logs(workspace_root, failed_services, tail=100)
-        print(logs)
+        log_lines: list[str] = []
+        for line in iter_service_logs(workspace_root, failed_services, tail=100):
+            print(line, end="")
+            log_lines.append(line)
+        logs = "".join(log_lines)
         print()
 
         # Analyze and provide guidance
@@ -877,16 +1467,57 @@ def dev_down(workspace_root: Path) -> int:
 
     print("Stopping any legacy services...")
 
-    # Stop legacy machina-med project (ignore errors)
+    # Stop legacy machina-med project (ignore errors); the output is
+    # never looked at, so skip the capture pipes entirely.
     run_command(
         ["docker", "compose", "-p", "machina-med", "down"],
         check=False,
         cwd=workspace_root,
+        discard_output=True,
     )
 
     return 0
 
 
+def _wait_for_qdrant(url: str, max_wait: float = 30.0) -> bool:
+    """Poll a Qdrant URL until it answers, with backoff and keep-alive.
+
+    Probes start at 100ms so a fast stack is detected almost instantly
+    instead of at 1-second granularity, backing off toward 2s while the
+    service is still coming up. One HTTP connection is reused across
+    probes, skipping a TCP handshake per try.
+
+    Args:
+        url: Qdrant REST API URL
+        max_wait: Maximum seconds to keep probing
+
+    Returns:
+        True if the endpoint answered with a 2xx/3xx status in time
+    """
+    parsed = urllib.parse.urlsplit(url)
+    conn = http.client.HTTPConnection(
+        parsed.hostname or "localhost", parsed.port or 80, timeout=1.0
+    )
+    path = parsed.path or "/"
+    delay = 0.1
+    deadline = time.monotonic() + max_wait
+    try:
+        while time.monotonic() < deadline:
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                response.read()
+                if 200 <= response.status < 400:
+                    return True
+            except (OSError, http.client.HTTPException):
+                conn.close()
+            time.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
+    finally:
+        conn.close()
+    return False
+
+
 def check_http_endpoint(url: str, timeout: float = 2.0) -> bool:
     """Check if an HTTP endpoint is responding.
 
@@ -897,6 +1528,8 @@ def check_http_endpoint(url: str, timeout: float = 2.0) -> bool:
     Returns:
         True if endpoint responds with 2xx or 3xx status
     """
+    import urllib.request
+
     try:
         req = urllib.request.Request(url, method="GET")
         with urllib.request.urlopen(req, timeout=timeout) as response:
@@ -905,6 +1538,21 @@ def check_http_endpoint(url: str, timeout: float = 2.0) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def _running_container_names() -> str:
+    """Names of running containers; one `docker ps` per process.
+
+    The five container checks in get_service_status all test membership
+    against the same listing, so fetch it once and let each check be an
+    O(1) substring test instead of its own subprocess.
+    """
+    result = run_command(
+        ["docker", "ps", "--format", "{{.Names}}"],
+        check=False,
+    )
+    return result.stdout
+
+
 def check_docker_container(name_pattern: str) -> bool:
     """Check if a docker container is running.
 
@@ -914,62 +1562,67 @@ def check_docker_container(name_pattern: str) -> bool:
     Returns:
         True if container is running
     """
-    result = run_command(
-        ["docker", "ps", "--format", "{{.Names}}"],
-        check=False,
-    )
-    return name_pattern in result.stdout
+    return name_pattern in _running_container_names()
+
+
+# Status assembly memo: dev_check's service sub-check and dev_status may
+# both want the same probe round within one invocation.
+_SERVICE_STATUS_TTL = 5.0
+_service_status_cache: tuple[float, list[dict]] | None = None
 
 
 def get_service_status(workspace_root: Path) -> list[dict]:
     """Get status of all development services.
 
+    The HTTP probes and the docker listing run concurrently, and the
+    assembled result is memoized for a few seconds so back-to-back
+    callers share a single probe round.
+
     Args:
         workspace_root: Path to workspace root directory
 
     Returns:
         List of service status dictionaries
     """
-    services = []
-
-    # Frontend
-    services.append(
+    global _service_status_cache
+    if _service_status_cache is not None:
+        cached_at, services = _service_status_cache
+        if time.monotonic() - cached_at < _SERVICE_STATUS_TTL:
+            return services
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        frontend = executor.submit(_probe_url, "http://localhost:3000")
+        backend = executor.submit(_probe_url, "http://localhost:8000/docs")
+        catalog = executor.submit(_probe_url, "http://localhost:8001/health")
+        # Prime the shared listing so the container checks below are
+        # cache hits rather than a serial docker ps.
+        executor.submit(_running_container_names)
+
+    services = [
         {
             "category": "Frontend",
             "service": "Frontend",
             "type": "Next.js",
             "ports": "3000",
-            "running": check_http_endpoint("http://localhost:3000"),
+            "running": frontend.result()[0],
             "url": "http://localhost:3000",
-        }
-    )
-
-    # Backend API
-    services.append(
+        },
         {
             "category": "Backend",
             "service": "Backend API",
             "type": "FastAPI",
             "ports": "8000",
-            "running": check_http_endpoint("http://localhost:8000/docs"),
+            "running": backend.result()[0],
             "url": "http://localhost:8000",
-        }
-    )
-
-    # Medical Catalog
-    services.append(
+        },
         {
             "category": "Backend",
             "service": "Medical Catalog",
             "type": "FastAPI",
             "ports": "8001",
-            "running": check_http_endpoint("http://localhost:8001/health"),
+            "running": catalog.result()[0],
             "url": "http://localhost:8001",
-        }
-    )
-
-    # PostgreSQL
-    services.append(
+        },
         {
             "category": "Database",
             "service": "PostgreSQL",
@@ -977,11 +1630,7 @@ def get_service_status(workspace_root: Path) -> list[dict]:
             "ports": "5432",
             "running": check_docker_container("postgres"),
             "url": "localhost:5432",
-        }
-    )
-
-    # Neo4j
-    services.append(
+        },
         {
             "category": "Database",
             "service": "Neo4j",
@@ -989,11 +1638,7 @@ def get_service_status(workspace_root: Path) -> list[dict]:
             "ports": "7474, 7687",
             "running": check_docker_container("neo4j"),
             "url": "http://localhost:7474",
-        }
-    )
-
-    # Redis
-    services.append(
+        },
         {
             "category": "Infrastructure",
             "service": "Redis",
@@ -1001,11 +1646,7 @@ def get_service_status(workspace_root: Path) -> list[dict]:
             "ports": "6379",
             "running": check_docker_container("redis"),
             "url": "localhost:6379",
-        }
-    )
-
-    # Qdrant
-    services.append(
+        },
         {
             "category": "Infrastructure",
             "service": "Qdrant",
@@ -1013,11 +1654,7 @@ def get_service_status(workspace_root: Path) -> list[dict]:
             "ports": "6333",
             "running": check_docker_container("qdrant"),
             "url": "http://localhost:6333",
-        }
-    )
-
-    # RedisInsight (optional)
-    services.append(
+        },
         {
             "category": "Dev Tools",
             "service": "RedisInsight",
@@ -1026,9 +1663,10 @@ def get_service_status(workspace_root: Path) -> list[dict]:
             "running": check_docker_container("redisinsight"),
             "url": "http://localhost:5540",
             "optional": True,
-        }
-    )
+        },
+    ]
 
+    _service_status_cache = (time.monotonic(), services)
     return services
 
 
@@ -1067,7 +1705,7 @@ def format_status_markdown(services: list[dict]) -> str:
         ])
 
     # Format as markdown table with pipe format
-    table = tabulate(rows, headers=headers, tablefmt="pipe")
+    table = format_table(rows, headers)
 
     return f"# Development Stack Status\n\n{table}"
 
@@ -1081,7 +1719,7 @@ def format_status_json(services: list[dict]) -> str:
     Returns:
         JSON string
     """
-    return json.dumps(services, indent=2)
+    return _dumps(services)
 
 
 def dev_status(workspace_root: Path, output_format: str = "markdown") -> int:
@@ -10,18 +10,33 @@ errors when querying ArgoCD applications may indicate the app doesn't exist or w
 already deleted, not necessarily a permissions issue.
 """
 
-import argparse
+import asyncio
+import atexit
+import contextlib
+import functools
+import http.client
 import json
 import os
-import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Optional, Tuple, List
 
+# Optional fast path: orjson parses the gh/kubectl/argocd payloads a few
+# times faster than stdlib json and takes bytes directly. Its decode
+# errors subclass json.JSONDecodeError, so existing handlers still work.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # ============================================================
 # Color and Output Utilities
@@ -46,14 +61,44 @@ class Symbol:
     WARN = "⚠️"
 
 
+# Active line buffer for buffered_output(); None means write-through.
+_output_buffer: Optional[List[str]] = None
+
+
+def _emit(line: str = "") -> None:
+    """Write a line now, or queue it while a buffered render is active."""
+    if _output_buffer is not None:
+        _output_buffer.append(line)
+    else:
+        print(line)
+
+
+@contextlib.contextmanager
+def buffered_output():
+    """Collect emitted lines and flush them to stdout in one write.
+
+    The render paths emit dozens of short lines; buffering them turns a
+    write syscall per line into a single one at the end of the block.
+    """
+    global _output_buffer
+    _output_buffer = []
+    try:
+        yield
+    finally:
+        lines = _output_buffer
+        _output_buffer = None
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+
 def print_color(color: str, message: str) -> None:
     """Print colored output."""
-    print(f"{color}{message}{Color.NC}")
+    _emit(f"{color}{message}{Color.NC}")
 
 
 def print_header(title: str) -> None:
     """Print section header."""
-    print()
+    _emit()
     print_color(Color.CYAN, "═" * 62)
     print_color(Color.CYAN, title)
     print_color(Color.CYAN, "═" * 62)
@@ -61,7 +106,14 @@ def print_header(title: str) -> None:
 
 def print_kv(key: str, value: str) -> None:
     """Print key-value pair."""
-    print(f"  {key:<25} {value}")
+    _emit(f"  {key:<25} {value}")
+
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# datetime.fromisoformat parses a trailing 'Z' natively from Python 3.11 on,
+# so the replace() is only needed on older interpreters.
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
 
 
 def format_timestamp(timestamp: Optional[str]) -> str:
@@ -69,8 +121,9 @@ def format_timestamp(timestamp: Optional[str]) -> str:
     if not timestamp or timestamp == "null":
         return "N/A"
     try:
-        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        if not _FROMISO_HANDLES_Z:
+            timestamp = timestamp.replace('Z', '+00:00')
+        return datetime.fromisoformat(timestamp).strftime(_TIMESTAMP_FORMAT)
     except (ValueError, AttributeError):
         return timestamp
 
@@ -85,6 +138,20 @@ WEBUI_REPO = WORKSPACE_ROOT / "repos" / "dem2-webui"
 INFRA_REPO = WORKSPACE_ROOT / "repos" / "dem2-infra"
 GITHUB_ORG = "NumberOne-AI"
 
+# Resolve the git binary once so every subprocess spawn skips the PATH walk.
+GIT_BIN = shutil.which("git") or "git"
+
+
+@functools.lru_cache(maxsize=None)
+def _repo_str(repo_path: Path) -> str:
+    """Cache str(repo_path) so hot argv construction skips Path rendering."""
+    return str(repo_path)
+
+
+def _git_argv(repo_path: Path, *args: str) -> List[str]:
+    """Build a `git -C <repo>` argv with the pre-resolved binary and path."""
+    return [GIT_BIN, "-C", _repo_str(repo_path), *args]
+
 
 # ============================================================
 # Exceptions
@@ -119,7 +186,53 @@ class IdentifierType(Enum):
     GIT_BRANCH = "git-branch"
 
 
-@dataclass
+# The resolver patterns are all "known prefix + non-empty tail"; plain
+# startswith/slicing does the same job as the anchored regexes they
+# replaced at a fraction of the dispatch cost.
+_PREVIEW_TAG_PREFIX = "preview-"
+_ARGOCD_APP_PREFIX = "preview-pr-"
+_GKE_NS_PREFIX = "tusdi-preview-"
+_INFRA_BRANCH_PREFIX = "preview/"
+_PR_TAG_PREFIX = "pr-"
+
+
+def _strip_prefix(value: str, prefix: str) -> Optional[str]:
+    """Return value without prefix, or None if it lacks it or has no tail."""
+    if value.startswith(prefix):
+        tail = value[len(prefix):]
+        if tail:
+            return tail
+    return None
+
+
+def classify_identifier(identifier: str) -> IdentifierType:
+    """Classify a bare identifier by shape.
+
+    Ordered prefix checks, most specific first: preview-pr-N must win
+    over the generic preview-* tag shape. Anything unrecognized is
+    treated as a git branch name.
+    """
+    if identifier.isdigit():
+        return IdentifierType.PR
+
+    tail = _strip_prefix(identifier, _ARGOCD_APP_PREFIX)
+    if tail is not None and tail.isdigit():
+        return IdentifierType.ARGOCD_APP
+
+    tail = _strip_prefix(identifier, _GKE_NS_PREFIX)
+    if tail is not None and tail.isdigit():
+        return IdentifierType.GKE_NAMESPACE
+
+    if _strip_prefix(identifier, _PREVIEW_TAG_PREFIX) is not None:
+        return IdentifierType.GIT_TAG
+
+    if _strip_prefix(identifier, _INFRA_BRANCH_PREFIX) is not None:
+        return IdentifierType.INFRA_BRANCH
+
+    return IdentifierType.GIT_BRANCH
+
+
+@dataclass(slots=True, frozen=True)
 class TagInfo:
     """Information about a git tag."""
     exists: bool
@@ -127,14 +240,14 @@ class TagInfo:
     date: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BranchInfo:
     """Information about a git branch."""
     exists: bool
     location: Optional[str] = None  # "LOCAL", "REMOTE", or None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PRInfo:
     """Information about a GitHub pull request."""
     number: int
@@ -149,7 +262,7 @@ class PRInfo:
     closed_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowRunInfo:
     """Information about a GitHub Actions workflow run."""
     id: int
@@ -168,125 +281,488 @@ class WorkflowRunInfo:
 # Command Utilities
 # ============================================================
 
+# On Linux, closing inherited descriptors is handled efficiently by the
+# vfork/posix_spawn path only when close_fds is False; the default True
+# forces a close_range/iteration over the fd table on every spawn. We
+# never open inheritable descriptors, so it is safe to skip.
+_POPEN_KWARGS = {"close_fds": False} if sys.platform.startswith("linux") else {}
+
+
 def run_command(
     cmd: List[str],
     cwd: Optional[Path] = None,
     check: bool = False,
-    capture_output: bool = True
+    capture_output: bool = True,
+    binary: bool = False
 ) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
+    """Run a shell command and return the result.
+
+    Callers that feed stdout straight into json.loads should pass
+    binary=True: json.loads accepts bytes, and skipping text=True avoids
+    an extra UTF-8 decode pass over large payloads.
+    """
     try:
         return subprocess.run(
             cmd,
             cwd=cwd,
             capture_output=capture_output,
-            text=True,
-            check=check
+            text=not binary,
+            check=check,
+            **_POPEN_KWARGS
         )
     except FileNotFoundError:
         raise CommandNotFoundError(f"Command not found: {cmd[0]}")
 
 
+def run_many(cmds: List[List[str]]) -> List[subprocess.CompletedProcess]:
+    """Run several commands concurrently, returning results in input order.
+
+    A batch of short-lived git invocations spends most of its wall time
+    in fork/exec and pipe I/O; launching them through asyncio overlaps
+    that latency instead of paying it once per command.
+    """
+    async def _gather() -> List[subprocess.CompletedProcess]:
+        async def _one(cmd: List[str]) -> subprocess.CompletedProcess:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            except FileNotFoundError:
+                raise CommandNotFoundError(f"Command not found: {cmd[0]}")
+            stdout, stderr = await proc.communicate()
+            return subprocess.CompletedProcess(
+                cmd, proc.returncode, stdout.decode(), stderr.decode()
+            )
+
+        return await asyncio.gather(*(_one(cmd) for cmd in cmds))
+
+    return asyncio.run(_gather())
+
+
+@functools.lru_cache(maxsize=None)
 def check_command_available(cmd: str) -> bool:
-    """Check if a command is available in PATH."""
-    result = run_command(["which", cmd])
-    return result.returncode == 0
+    """Check if a command is available in PATH.
+
+    Memoized: availability doesn't change within a single run, and
+    shutil.which walks PATH in-process instead of forking `which`.
+    """
+    return shutil.which(cmd) is not None
 
 
 # ============================================================
 # Git Operations
 # ============================================================
 
+class GitBatch:
+    """Persistent `git cat-file --batch-check` process for a single repository.
+
+    Spawning git once and streaming ref names over stdin avoids a fork/exec
+    per lookup, which dominates wall time when many refs are probed in a run.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self._proc: Optional[subprocess.Popen] = None
+
+    def _ensure_proc(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                _git_argv(self.repo_path, "cat-file",
+                 "--batch-check=%(objectname) %(objecttype)"),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+        return self._proc
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """Resolve a ref to its object SHA, or None if it does not exist."""
+        try:
+            proc = self._ensure_proc()
+            proc.stdin.write(f"{ref}\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline().strip()
+        except (OSError, ValueError):
+            return None
+
+        if not line or line.endswith(" missing"):
+            return None
+
+        return line.split()[0]
+
+    def close(self) -> None:
+        """Close stdin so the child git process exits cleanly."""
+        if self._proc is not None and self._proc.poll() is None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+        self._proc = None
+
+
+_GIT_BATCH: dict = {}
+
+
+def _git_batch(repo_path: Path) -> GitBatch:
+    """Get (or create) the persistent git batch process for a repository."""
+    batch = _GIT_BATCH.get(repo_path)
+    if batch is None:
+        batch = _GIT_BATCH[repo_path] = GitBatch(repo_path)
+    return batch
+
+
+@atexit.register
+def _close_git_batches() -> None:
+    for batch in _GIT_BATCH.values():
+        batch.close()
+
+
+_PREVIEW_TAG_META: dict = {}
+
+
+def list_preview_tags_with_meta(repo_path: Path) -> List[Tuple[str, str, str]]:
+    """Get all preview tags with commit and date, newest first.
+
+    Runs a single `git for-each-ref` per repository and caches the result
+    for the lifetime of the process (tags don't change mid-run), replacing
+    the per-tag rev-parse + log calls that would otherwise be O(N) execs.
+
+    Returns:
+        List of (tag_name, commit_sha, creator_date) tuples
+    """
+    meta = _PREVIEW_TAG_META.get(repo_path)
+    if meta is None:
+        meta = []
+        if _repo_exists(repo_path):
+            result = run_command(_git_argv(repo_path, "for-each-ref",
+                "--sort=-creatordate",
+                "--format=%(refname:short)%00%(objectname)%00%(creatordate:iso)",
+                "refs/tags/preview-*"
+            ))
+            if result.returncode == 0:
+                for line in result.stdout.splitlines():
+                    parts = line.split("\0")
+                    if len(parts) == 3:
+                        meta.append((parts[0], parts[1], parts[2]))
+        _PREVIEW_TAG_META[repo_path] = meta
+    return meta
+
+
+@functools.lru_cache(maxsize=None)
+def _repo_exists(repo_path: Path) -> bool:
+    """Memoize repo-directory existence; it cannot change mid-run."""
+    return repo_path.exists()
+
+
+_PREVIEW_TAG_INDEX: dict = {}
+
+
+def preview_tag_index(repo_path: Path) -> dict:
+    """Dict view of the cached preview-tag listing: {tag: (sha, date)}.
+
+    Lets callers test existence and fetch metadata in O(1) instead of
+    scanning the ordered tuple list.
+    """
+    index = _PREVIEW_TAG_INDEX.get(repo_path)
+    if index is None:
+        index = {
+            name: (commit, date)
+            for name, commit, date in list_preview_tags_with_meta(repo_path)
+        }
+        _PREVIEW_TAG_INDEX[repo_path] = index
+    return index
+
+
 def check_git_tag(repo_path: Path, tag: str) -> TagInfo:
     """Check if a git tag exists in a repository."""
-    if not repo_path.exists():
+    if not _repo_exists(repo_path):
         return TagInfo(exists=False)
 
-    result = run_command(["git", "-C", str(repo_path), "rev-parse", tag])
-    if result.returncode != 0:
+    # Preview tags are covered by the cached bulk listing; answer from it
+    # without touching git at all.
+    if tag.startswith("preview-"):
+        entry = preview_tag_index(repo_path).get(tag)
+        if entry:
+            return TagInfo(exists=True, commit=entry[0], date=entry[1])
         return TagInfo(exists=False)
 
-    commit = result.stdout.strip()
+    commit = _git_batch(repo_path).resolve(tag)
+    if commit is None:
+        return TagInfo(exists=False)
 
-    result = run_command(["git", "-C", str(repo_path), "log", "-1", "--format=%ai", tag])
+    result = run_command(_git_argv(repo_path, "log", "-1", "--format=%ai", tag))
     date = result.stdout.strip() if result.returncode == 0 else None
 
     return TagInfo(exists=True, commit=commit, date=date)
 
 
+_BRANCH_INDEX: dict = {}
+
+
+def load_branch_index(repo_path: Path) -> set:
+    """Enumerate all local and origin branch refs in one git call.
+
+    Cached per repo so N branch probes cost one for-each-ref instead of
+    up to 2N show-ref execs.
+    """
+    refs = _BRANCH_INDEX.get(repo_path)
+    if refs is None:
+        result = run_command(_git_argv(repo_path, "for-each-ref",
+            "--format=%(refname)", "refs/heads/", "refs/remotes/origin/"
+        ))
+        refs = set(result.stdout.split()) if result.returncode == 0 else set()
+        _BRANCH_INDEX[repo_path] = refs
+    return refs
+
+
 def check_git_branch(repo_path: Path, branch: str) -> BranchInfo:
     """Check if a git branch exists in a repository."""
-    if not repo_path.exists():
+    if not _repo_exists(repo_path):
         return BranchInfo(exists=False)
 
-    # Check local branches
-    result = run_command([
-        "git", "-C", str(repo_path), "show-ref", "--verify", "--quiet",
-        f"refs/heads/{branch}"
-    ])
-    if result.returncode == 0:
+    refs = load_branch_index(repo_path)
+
+    if f"refs/heads/{branch}" in refs:
         return BranchInfo(exists=True, location="LOCAL")
 
-    # Check remote branches
-    result = run_command([
-        "git", "-C", str(repo_path), "show-ref", "--verify", "--quiet",
-        f"refs/remotes/origin/{branch}"
-    ])
-    if result.returncode == 0:
+    if f"refs/remotes/origin/{branch}" in refs:
         return BranchInfo(exists=True, location="REMOTE")
 
     return BranchInfo(exists=False)
 
 
+@functools.lru_cache(maxsize=None)
 def get_remote_preview_branches(repo_path: Path) -> List[str]:
-    """Get all remote preview branches from a repository."""
-    if not repo_path.exists():
+    """Get all remote preview branches from a repository.
+
+    Memoized: both resolvers and the delete flow enumerate the same
+    remote branches within one run.
+    """
+    if not _repo_exists(repo_path):
         return []
 
-    result = run_command(["git", "-C", str(repo_path), "branch", "-r"])
+    # Let git filter on the preview/ prefix itself; lstrip=4 drops
+    # refs/remotes/origin/preview so the output is already the answer.
+    result = run_command(_git_argv(repo_path, "for-each-ref",
+        "--format=%(refname:lstrip=4)", "refs/remotes/origin/preview/"
+    ))
     if result.returncode != 0:
         return []
 
-    branches = []
-    for line in result.stdout.splitlines():
-        line = line.strip()
-        if "origin/preview/" in line:
-            branch = line.replace("origin/preview/", "")
-            branches.append(branch)
-
-    return branches
+    return [line for line in result.stdout.splitlines() if line]
 
 
 def get_preview_tags_sorted(repo_path: Path) -> List[str]:
     """Get all preview tags sorted by creation date (newest first)."""
-    if not repo_path.exists():
-        return []
+    return [tag for tag, _, _ in list_preview_tags_with_meta(repo_path)]
+
+
+@functools.lru_cache(maxsize=None)
+def _git_dir(repo_path: Path) -> Optional[Path]:
+    """Resolve a repo's .git directory, following submodule indirection.
+
+    Submodule checkouts store a `gitdir: <path>` pointer file instead of
+    a directory.
+    """
+    git_path = repo_path / ".git"
+    if git_path.is_dir():
+        return git_path
+    if git_path.is_file():
+        try:
+            content = git_path.read_text()
+        except OSError:
+            return None
+        if content.startswith("gitdir:"):
+            return (repo_path / content.split(":", 1)[1].strip()).resolve()
+    return None
+
+
+_PACKED_TAGS: dict = {}
 
-    result = run_command([
-        "git", "-C", str(repo_path), "tag", "-l", "preview-*",
-        "--sort=-creatordate"
-    ])
-    if result.returncode != 0:
-        return []
 
-    return [tag.strip() for tag in result.stdout.splitlines() if tag.strip()]
+def _packed_ref_tags(repo_path: Path) -> set:
+    """Cached set of tag names from packed-refs (one file read per repo)."""
+    tags = _PACKED_TAGS.get(repo_path)
+    if tags is None:
+        tags = set()
+        git_dir = _git_dir(repo_path)
+        if git_dir is not None:
+            try:
+                with open(git_dir / "packed-refs") as f:
+                    for line in f:
+                        if line.startswith(("#", "^")):
+                            continue
+                        parts = line.split()
+                        if len(parts) == 2 and parts[1].startswith("refs/tags/"):
+                            tags.add(parts[1][len("refs/tags/"):])
+            except OSError:
+                pass
+        _PACKED_TAGS[repo_path] = tags
+    return tags
+
+
+def _tag_exists(repo_path: Path, tag: str) -> bool:
+    """Test local tag existence by looking at the ref store directly.
+
+    A loose-ref stat or the cached packed-refs set answers in
+    microseconds what a `git rev-parse` spawn answers in milliseconds.
+    """
+    git_dir = _git_dir(repo_path)
+    if git_dir is None:
+        return False
+    if (git_dir / "refs" / "tags" / tag).exists():
+        return True
+    return tag in _packed_ref_tags(repo_path)
 
 
 def check_tag_is_ancestor(repo_path: Path, tag: str, branch: str) -> bool:
     """Check if a tag is an ancestor of a branch."""
-    result = run_command([
-        "git", "-C", str(repo_path), "merge-base", "--is-ancestor",
+    result = run_command(_git_argv(repo_path, "merge-base", "--is-ancestor",
         tag, branch
-    ])
+    ))
     return result.returncode == 0
 
 
+def _newest_preview_tag_on(repo_path: Path, branch: str) -> Optional[str]:
+    """Return the newest preview tag reachable from branch, minus prefix.
+
+    One `git tag --merged` answers "which preview tags are ancestors of
+    this branch" server-side, replacing a merge-base spawn per tag.
+    Returns None if the branch is unknown or carries no preview tag.
+    """
+    result = run_command(_git_argv(repo_path, "tag",
+        "--merged", branch, "--list", "preview-*", "--sort=-creatordate"
+    ))
+    if result.returncode != 0:
+        return None
+
+    for tag in result.stdout.splitlines():
+        tag_id = _strip_prefix(tag, _PREVIEW_TAG_PREFIX)
+        if tag_id:
+            return tag_id
+    return None
+
+
 # ============================================================
 # GitHub Operations
 # ============================================================
 
+# Direct REST access to api.github.com over a keep-alive connection.
+# Each `gh` invocation forks a process and opens a fresh TLS session;
+# reusing one HTTPS connection amortizes that to a single handshake.
+# Any failure falls back to the gh CLI path, so this is purely a fast
+# path, never a new requirement.
+
+_gh_token_resolved = False
+_gh_token: Optional[str] = None
+
+
+def _github_token() -> Optional[str]:
+    """Resolve a GitHub token once: env vars first, then `gh auth token`."""
+    global _gh_token_resolved, _gh_token
+    if not _gh_token_resolved:
+        token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+        if not token and check_command_available("gh"):
+            result = run_command(["gh", "auth", "token"])
+            if result.returncode == 0:
+                token = result.stdout.strip() or None
+        _gh_token = token
+        _gh_token_resolved = True
+    return _gh_token
+
+
+_gh_api_local = threading.local()
+
+
+def _github_api_get(path: str):
+    """GET a GitHub REST path, reusing one HTTPS connection per thread.
+
+    Returns the decoded JSON payload, or None on any failure (no token,
+    non-200 response, connection error).
+    """
+    token = _github_token()
+    if not token:
+        return None
+
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "preview-tool",
+    }
+
+    for _ in range(2):  # one retry with a fresh connection for stale keep-alives
+        conn = getattr(_gh_api_local, "conn", None)
+        try:
+            if conn is None:
+                conn = http.client.HTTPSConnection("api.github.com", timeout=10)
+                _gh_api_local.conn = conn
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            if response.status != 200:
+                return None
+            return _json_loads(body)
+        except (OSError, http.client.HTTPException, json.JSONDecodeError):
+            _gh_api_local.conn = None
+            if conn is not None:
+                try:
+                    conn.close()
+                except OSError:
+                    pass
+    return None
+
+
+def _pr_info_from_rest(data: dict) -> PRInfo:
+    """Build PRInfo from a GitHub REST pull request payload."""
+    if data.get("merged_at"):
+        state = "MERGED"
+    else:
+        state = data["state"].upper()
+    return PRInfo(
+        number=data["number"],
+        title=data["title"],
+        state=state,
+        head_ref=data["head"]["ref"],
+        base_ref=data["base"]["ref"],
+        url=data["html_url"],
+        author=data["user"]["login"],
+        created_at=data["created_at"],
+        merged_at=data.get("merged_at"),
+        closed_at=data.get("closed_at")
+    )
+
+
+def _pr_info_from_graphql(node: dict) -> PRInfo:
+    """Build PRInfo from a GitHub GraphQL pullRequest node."""
+    return PRInfo(
+        number=node["number"],
+        title=node["title"],
+        state=node["state"],
+        head_ref=node["headRefName"],
+        base_ref=node["baseRefName"],
+        url=node["url"],
+        author=node["author"]["login"],
+        created_at=node["createdAt"],
+        merged_at=node.get("mergedAt"),
+        closed_at=node.get("closedAt")
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def get_pr_info(repo: str, pr_number: int) -> Optional[PRInfo]:
-    """Get PR information from GitHub using gh CLI."""
+    """Get PR information from GitHub (REST fast path, gh CLI fallback)."""
+    data = _github_api_get(f"/repos/{GITHUB_ORG}/{repo}/pulls/{pr_number}")
+    if data:
+        try:
+            return _pr_info_from_rest(data)
+        except (KeyError, TypeError):
+            pass
+
     if not check_command_available("gh"):
         return None
 
@@ -294,13 +770,13 @@ def get_pr_info(repo: str, pr_number: int) -> Optional[PRInfo]:
         "gh", "pr", "view", str(pr_number),
         "--repo", f"{GITHUB_ORG}/{repo}",
         "--json", "number,title,state,headRefName,baseRefName,url,author,createdAt,mergedAt,closedAt"
-    ])
+    ], binary=True)
 
     if result.returncode != 0:
         return None
 
     try:
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)
         return PRInfo(
             number=data["number"],
             title=data["title"],
@@ -317,8 +793,24 @@ def get_pr_info(repo: str, pr_number: int) -> Optional[PRInfo]:
         return None
 
 
-def get_pr_by_branch(repo: str, branch: str) -> Optional[int]:
-    """Find PR number for a branch in a repository."""
+@functools.lru_cache(maxsize=None)
+def get_pr_info_by_branch(repo: str, branch: str) -> Optional[PRInfo]:
+    """Find the PR for a branch with all fields in a single gh call.
+
+    Avoids the lookup-number-then-view round trip: one `gh pr list` with
+    the full field projection answers both "is there a PR?" and "what
+    does it look like?".
+    """
+    data = _github_api_get(
+        f"/repos/{GITHUB_ORG}/{repo}/pulls"
+        f"?head={GITHUB_ORG}:{branch}&state=open&per_page=1"
+    )
+    if data:
+        try:
+            return _pr_info_from_rest(data[0])
+        except (KeyError, TypeError, IndexError):
+            pass
+
     if not check_command_available("gh"):
         return None
 
@@ -326,19 +818,41 @@ def get_pr_by_branch(repo: str, branch: str) -> Optional[int]:
         "gh", "pr", "list",
         "--repo", f"{GITHUB_ORG}/{repo}",
         "--head", branch,
-        "--json", "number",
-        "--jq", ".[0].number"
-    ])
+        "--json", "number,title,state,headRefName,baseRefName,url,author,createdAt,mergedAt,closedAt",
+        "--limit", "1"
+    ], binary=True)
 
     if result.returncode != 0 or not result.stdout.strip():
         return None
 
     try:
-        return int(result.stdout.strip())
-    except ValueError:
+        prs = _json_loads(result.stdout)
+        if not prs:
+            return None
+        data = prs[0]
+        return PRInfo(
+            number=data["number"],
+            title=data["title"],
+            state=data["state"],
+            head_ref=data["headRefName"],
+            base_ref=data["baseRefName"],
+            url=data["url"],
+            author=data["author"]["login"],
+            created_at=data["createdAt"],
+            merged_at=data.get("mergedAt"),
+            closed_at=data.get("closedAt")
+        )
+    except (json.JSONDecodeError, KeyError):
         return None
 
 
+def get_pr_by_branch(repo: str, branch: str) -> Optional[int]:
+    """Find PR number for a branch in a repository."""
+    pr_info = get_pr_info_by_branch(repo, branch)
+    return pr_info.number if pr_info else None
+
+
+@functools.lru_cache(maxsize=None)
 def get_infra_pr_number(preview_id: str) -> Optional[int]:
     """Get the infra PR number for a preview ID."""
     if not check_command_available("gh"):
@@ -388,13 +902,13 @@ def get_workflow_runs(repo: str, ref: str, limit: int = 5) -> List[WorkflowRunIn
         "--branch", ref,
         "--limit", str(limit),
         "--json", "databaseId,name,status,conclusion,headBranch,headSha,displayTitle,url,createdAt,updatedAt"
-    ])
+    ], binary=True)
 
     if result.returncode != 0 or not result.stdout.strip():
         return []
 
     try:
-        runs_data = json.loads(result.stdout)
+        runs_data = _json_loads(result.stdout)
         runs = []
         for run in runs_data:
             runs.append(WorkflowRunInfo(
@@ -423,35 +937,50 @@ def get_namespace_annotations(namespace: str) -> Optional[dict]:
     if not check_command_available("kubectl"):
         return None
 
+    # Project server-side to just the annotations map instead of pulling
+    # the whole namespace object back and parsing it for one field;
+    # kubectl renders map nodes as JSON objects.
     result = run_command([
         "kubectl", "get", "namespace", namespace,
-        "-o", "json"
-    ])
+        "-o", "jsonpath={.metadata.annotations}"
+    ], binary=True)
 
     if result.returncode != 0:
         return None
 
+    if not result.stdout.strip():
+        return {}
+
     try:
-        data = json.loads(result.stdout)
-        return data.get("metadata", {}).get("annotations", {})
-    except (json.JSONDecodeError, KeyError):
+        return _json_loads(result.stdout)
+    except json.JSONDecodeError:
         return None
 
 
+# Annotation keys ArgoCD is known to set, most specific first. Direct dict
+# lookups replace the lowercase substring scan over every annotation.
+_ARGOCD_ANNOTATION_KEYS = (
+    "argocd.argoproj.io/instance",
+    "argocd.argoproj.io/application",
+    "app.kubernetes.io/instance",
+)
+
+
 def get_argocd_app_from_namespace(namespace: str) -> Optional[str]:
     """Get ArgoCD application name from namespace annotations."""
     annotations = get_namespace_annotations(namespace)
     if not annotations:
         return None
 
-    # Look for common ArgoCD annotations
-    # ArgoCD sets annotations like argocd.argoproj.io/instance or similar
+    for key in _ARGOCD_ANNOTATION_KEYS:
+        value = annotations.get(key)
+        if value:
+            return value
+
+    # Fallback for non-standard annotation keys
     for key, value in annotations.items():
         if "argocd" in key.lower() and "app" in key.lower():
             return value
-        # Also check for common naming patterns in labels
-        if key == "app.kubernetes.io/instance":
-            return value
 
     return None
 
@@ -465,29 +994,50 @@ def get_argocd_app_status(app_name: str) -> Optional[dict]:
     if not check_command_available("argocd"):
         return None
 
-    result = run_command(["argocd", "app", "get", app_name, "-o", "json"])
+    result = run_command(["argocd", "app", "get", app_name, "-o", "json"], binary=True)
 
     if result.returncode != 0:
         return None
 
     try:
-        return json.loads(result.stdout)
+        return _json_loads(result.stdout)
     except json.JSONDecodeError:
         return None
 
 
+# argocd app list downloads every application; cache it briefly so the
+# resolver's consecutive namespace probes reuse one fetch instead of
+# re-downloading the full list per call.
+_ARGOCD_APP_LIST_TTL = 30.0
+_argocd_app_list_cache: Optional[Tuple[float, Optional[List[dict]]]] = None
+
+
 def list_argocd_apps() -> Optional[List[dict]]:
-    """List all ArgoCD applications."""
+    """List all ArgoCD applications (cached for a short interval)."""
+    global _argocd_app_list_cache
+
+    if _argocd_app_list_cache is not None:
+        fetched_at, apps = _argocd_app_list_cache
+        if time.monotonic() - fetched_at < _ARGOCD_APP_LIST_TTL:
+            return apps
+
+    apps = _fetch_argocd_apps()
+    _argocd_app_list_cache = (time.monotonic(), apps)
+    return apps
+
+
+def _fetch_argocd_apps() -> Optional[List[dict]]:
+    """Fetch the full ArgoCD application list from the server."""
     if not check_command_available("argocd"):
         return None
 
-    result = run_command(["argocd", "app", "list", "-o", "json"])
+    result = run_command(["argocd", "app", "list", "-o", "json"], binary=True)
 
     if result.returncode != 0:
         return None
 
     try:
-        return json.loads(result.stdout)
+        return _json_loads(result.stdout)
     except json.JSONDecodeError:
         return None
 
@@ -509,12 +1059,16 @@ def get_argocd_app_for_namespace(namespace: str) -> Optional[str]:
     return None
 
 
-def delete_argocd_app(app_name: str) -> bool:
-    """Delete an ArgoCD application."""
-    if not check_command_available("argocd"):
+def delete_argocd_app(*app_names: str) -> bool:
+    """Delete one or more ArgoCD applications in a single CLI call.
+
+    argocd app delete accepts multiple names, so batch deletions pay the
+    login/connection overhead once instead of per application.
+    """
+    if not app_names or not check_command_available("argocd"):
         return False
 
-    result = run_command(["argocd", "app", "delete", app_name, "--yes"])
+    result = run_command(["argocd", "app", "delete", *app_names, "--yes"])
     return result.returncode == 0
 
 
@@ -529,66 +1083,56 @@ class PreviewEnvironment:
         self.preview_id = preview_id
         self.id_type = id_type
         self.original_identifier = original_identifier
+        self._pr_context: Optional[dict] = None
+        self._argocd_name_cache: Optional[Tuple[str, Optional[int]]] = None
 
     @classmethod
     def resolve(cls, id_type: IdentifierType, identifier: str) -> "PreviewEnvironment":
         """Resolve an identifier to a preview environment."""
-
-        if id_type == IdentifierType.GIT_TAG:
-            return cls._resolve_git_tag(identifier)
-        elif id_type == IdentifierType.ARGOCD_APP:
-            return cls._resolve_argocd_app(identifier)
-        elif id_type == IdentifierType.GKE_NAMESPACE:
-            return cls._resolve_gke_namespace(identifier)
-        elif id_type == IdentifierType.INFRA_BRANCH:
-            return cls._resolve_infra_branch(identifier)
-        elif id_type == IdentifierType.PR:
-            return cls._resolve_pr(identifier)
-        elif id_type == IdentifierType.GIT_BRANCH:
-            return cls._resolve_git_branch(identifier)
-        else:
+        try:
+            resolver = _RESOLVERS[id_type]
+        except KeyError:
             raise ResolutionError(f"Unknown identifier type: {id_type}")
+        return resolver(identifier)
 
     @classmethod
     def _resolve_git_tag(cls, identifier: str) -> "PreviewEnvironment":
         """Resolve git tag to preview ID."""
-        match = re.match(r"^preview-(.+)$", identifier)
-        if not match:
+        preview_id = _strip_prefix(identifier, _PREVIEW_TAG_PREFIX)
+        if preview_id is None:
             raise ResolutionError("Git tag must start with 'preview-'")
 
-        preview_id = match.group(1)
         return cls(preview_id, IdentifierType.GIT_TAG, identifier)
 
     @classmethod
     def _resolve_argocd_app(cls, identifier: str) -> "PreviewEnvironment":
         """Resolve ArgoCD app name to preview ID."""
-        match = re.match(r"^preview-pr-(\d+)$", identifier)
-        if not match:
+        pr_tail = _strip_prefix(identifier, _ARGOCD_APP_PREFIX)
+        if pr_tail is None or not pr_tail.isdigit():
             raise ResolutionError("ArgoCD app must be in format 'preview-pr-NUMBER'")
 
         if not check_command_available("gh"):
             raise CommandNotFoundError("gh CLI required for ArgoCD app resolution")
 
-        infra_pr_num = int(match.group(1))
+        infra_pr_num = int(pr_tail)
         pr_info = get_pr_info("dem2-infra", infra_pr_num)
 
         if not pr_info:
             raise ResolutionError(f"Could not resolve ArgoCD app '{identifier}' to preview ID")
 
-        branch_match = re.match(r"^preview/(.+)$", pr_info.head_ref)
-        if not branch_match:
+        preview_id = _strip_prefix(pr_info.head_ref, _INFRA_BRANCH_PREFIX)
+        if preview_id is None:
             raise ResolutionError(f"Infra PR #{infra_pr_num} branch is not a preview branch")
 
-        preview_id = branch_match.group(1)
         return cls(preview_id, IdentifierType.ARGOCD_APP, identifier)
 
     @classmethod
     def _resolve_gke_namespace(cls, identifier: str) -> "PreviewEnvironment":
         """Resolve GKE namespace to preview ID."""
         # Try preview namespace format first: tusdi-preview-NUMBER
-        match = re.match(r"^tusdi-preview-(\d+)$", identifier)
-        if match:
-            infra_pr_num = int(match.group(1))
+        ns_tail = _strip_prefix(identifier, _GKE_NS_PREFIX)
+        if ns_tail is not None and ns_tail.isdigit():
+            infra_pr_num = int(ns_tail)
 
             if not check_command_available("gh"):
                 print_color(Color.YELLOW, "Warning: gh CLI not available, using fallback")
@@ -596,11 +1140,8 @@ class PreviewEnvironment:
             else:
                 pr_info = get_pr_info("dem2-infra", infra_pr_num)
                 if pr_info:
-                    branch_match = re.match(r"^preview/(.+)$", pr_info.head_ref)
-                    if branch_match:
-                        preview_id = branch_match.group(1)
-                    else:
-                        preview_id = str(infra_pr_num)
+                    preview_id = (_strip_prefix(pr_info.head_ref, _INFRA_BRANCH_PREFIX)
+                                  or str(infra_pr_num))
                 else:
                     preview_id = str(infra_pr_num)
 
@@ -608,6 +1149,14 @@ class PreviewEnvironment:
 
         # For any other namespace, try multiple resolution strategies
 
+        # Short-circuit: a namespace that doesn't look preview-related
+        # can't resolve further; skip the kubectl annotation lookup and
+        # the full ArgoCD app listing and use the name directly.
+        if not (identifier.startswith("preview")
+                or identifier.startswith("tusdi-")
+                or "-preview-" in identifier):
+            return cls(identifier, IdentifierType.GKE_NAMESPACE, identifier)
+
         # Strategy 1: Check namespace annotations for ArgoCD app
         argocd_app = get_argocd_app_from_namespace(identifier)
 
@@ -618,15 +1167,14 @@ class PreviewEnvironment:
         if argocd_app:
             # Try to parse ArgoCD app name to get preview ID
             # Format: preview-pr-NUMBER
-            app_match = re.match(r"^preview-pr-(\d+)$", argocd_app)
-            if app_match:
-                infra_pr_num = int(app_match.group(1))
+            app_tail = _strip_prefix(argocd_app, _ARGOCD_APP_PREFIX)
+            if app_tail is not None and app_tail.isdigit():
+                infra_pr_num = int(app_tail)
                 if check_command_available("gh"):
                     pr_info = get_pr_info("dem2-infra", infra_pr_num)
                     if pr_info:
-                        branch_match = re.match(r"^preview/(.+)$", pr_info.head_ref)
-                        if branch_match:
-                            preview_id = branch_match.group(1)
+                        preview_id = _strip_prefix(pr_info.head_ref, _INFRA_BRANCH_PREFIX)
+                        if preview_id:
                             return cls(preview_id, IdentifierType.GKE_NAMESPACE, identifier)
 
                 preview_id = str(infra_pr_num)
@@ -643,11 +1191,10 @@ class PreviewEnvironment:
     @classmethod
     def _resolve_infra_branch(cls, identifier: str) -> "PreviewEnvironment":
         """Resolve infra branch to preview ID."""
-        match = re.match(r"^preview/(.+)$", identifier)
-        if not match:
+        preview_id = _strip_prefix(identifier, _INFRA_BRANCH_PREFIX)
+        if preview_id is None:
             raise ResolutionError("Infra branch must start with 'preview/'")
 
-        preview_id = match.group(1)
         return cls(preview_id, IdentifierType.INFRA_BRANCH, identifier)
 
     @classmethod
@@ -664,9 +1211,8 @@ class PreviewEnvironment:
         # Check dem2-infra first (gives us current preview environment)
         pr_info = get_pr_info("dem2-infra", pr_num)
         if pr_info:
-            branch_match = re.match(r"^preview/(.+)$", pr_info.head_ref)
-            if branch_match:
-                preview_id = branch_match.group(1)
+            preview_id = _strip_prefix(pr_info.head_ref, _INFRA_BRANCH_PREFIX)
+            if preview_id:
                 return cls(preview_id, IdentifierType.PR, identifier)
 
         # Check dem2 - find LATEST preview tag, not just any ancestor
@@ -677,24 +1223,22 @@ class PreviewEnvironment:
         dem2_branch = pr_info.head_ref
         preview_id = None
 
-        # Look for active preview in dem2-infra by searching for the branch name
+        # Look for active preview in dem2-infra by searching for the branch
+        # name. Tag existence is answered from the cached for-each-ref
+        # listing (no subprocess at all); the ancestor checks stay serial
+        # to preserve the first-match preference.
         preview_branches = get_remote_preview_branches(INFRA_REPO)
+        known_tags = preview_tag_index(DEM2_REPO)
         for infra_branch in preview_branches:
             tag = f"preview-{infra_branch}"
-            result = run_command(["git", "-C", str(DEM2_REPO), "rev-parse", tag])
-            if result.returncode == 0:
+            if tag in known_tags:
                 if check_tag_is_ancestor(DEM2_REPO, tag, f"origin/{dem2_branch}"):
                     preview_id = infra_branch
                     break
 
         # Fallback: look for ANY preview tag on this branch (least preferred)
         if not preview_id:
-            tags = get_preview_tags_sorted(DEM2_REPO)
-            for tag in tags:
-                tag_id = tag.replace("preview-", "")
-                if check_tag_is_ancestor(DEM2_REPO, tag, f"origin/{dem2_branch}"):
-                    preview_id = tag_id
-                    break
+            preview_id = _newest_preview_tag_on(DEM2_REPO, f"origin/{dem2_branch}")
 
         if not preview_id:
             raise ResolutionError(f"Could not find preview environment for PR #{pr_num}")
@@ -714,34 +1258,32 @@ class PreviewEnvironment:
 
         preview_id = None
 
-        # Look for active preview in dem2-infra
+        # The remote ref doesn't change during the scan below, so verify
+        # it once up front; a missing branch short-circuits the whole
+        # resolution instead of failing once per candidate.
+        remote_ref = f"origin/{identifier}"
+        result = run_command(_git_argv(DEM2_REPO, "rev-parse", "--quiet", "--verify",
+            remote_ref
+        ))
+        if result.returncode != 0:
+            raise ResolutionError(f"Branch '{identifier}' not found on origin in dem2")
+
+        # Look for active preview in dem2-infra, answering tag existence
+        # from the cached for-each-ref listing (as in _resolve_pr); the
+        # ancestor checks stay serial to preserve the first-match
+        # preference.
         preview_branches = get_remote_preview_branches(INFRA_REPO)
+        known_tags = preview_tag_index(DEM2_REPO)
         for infra_branch in preview_branches:
             tag = f"preview-{infra_branch}"
-            result = run_command(["git", "-C", str(DEM2_REPO), "rev-parse", tag])
-            if result.returncode == 0:
-                result = run_command([
-                    "git", "-C", str(DEM2_REPO), "rev-parse", "--verify",
-                    f"origin/{identifier}"
-                ])
-                if result.returncode == 0:
-                    if check_tag_is_ancestor(DEM2_REPO, tag, f"origin/{identifier}"):
-                        preview_id = infra_branch
-                        break
+            if tag in known_tags:
+                if check_tag_is_ancestor(DEM2_REPO, tag, remote_ref):
+                    preview_id = infra_branch
+                    break
 
         # Fallback: look for ANY preview tag on this branch
         if not preview_id:
-            tags = get_preview_tags_sorted(DEM2_REPO)
-            for tag in tags:
-                tag_id = tag.replace("preview-", "")
-                result = run_command([
-                    "git", "-C", str(DEM2_REPO), "rev-parse", "--verify",
-                    f"origin/{identifier}"
-                ])
-                if result.returncode == 0:
-                    if check_tag_is_ancestor(DEM2_REPO, tag, f"origin/{identifier}"):
-                        preview_id = tag_id
-                        break
+            preview_id = _newest_preview_tag_on(DEM2_REPO, remote_ref)
 
         if not preview_id:
             raise ResolutionError(f"Could not find preview environment for branch '{identifier}'")
@@ -749,12 +1291,70 @@ class PreviewEnvironment:
         return cls(preview_id, IdentifierType.GIT_BRANCH, identifier)
 
     def get_argocd_app_name(self) -> Tuple[str, Optional[int]]:
-        """Get the ArgoCD application name and infra PR number."""
-        infra_pr_num = get_infra_pr_number(self.preview_id)
-        if infra_pr_num:
-            return f"preview-pr-{infra_pr_num}", infra_pr_num
-        else:
-            return f"preview-{self.preview_id}", None
+        """Get the ArgoCD application name and infra PR number.
+
+        Cached on the instance: both the info and delete flows ask for
+        the name more than once, and the answer rides the bundled PR
+        context when one has been fetched.
+        """
+        if self._argocd_name_cache is None:
+            ctx = self._pr_context or {}
+            if ctx.get("ok"):
+                infra_pr = ctx.get("infra")
+                infra_pr_num = infra_pr.number if infra_pr else None
+            else:
+                infra_pr_num = get_infra_pr_number(self.preview_id)
+            if infra_pr_num:
+                self._argocd_name_cache = (f"preview-pr-{infra_pr_num}", infra_pr_num)
+            else:
+                self._argocd_name_cache = (f"preview-{self.preview_id}", None)
+        return self._argocd_name_cache
+
+    def _fetch_pr_context(self, dem2_pr_number: Optional[int]) -> dict:
+        """Fetch all PR context for this preview in one gh api graphql call.
+
+        Bundles the infra PR (looked up by its preview/ head branch) and,
+        when the preview ID encodes one, the dem2 PR into a single GitHub
+        round trip instead of separate gh invocations. Returns a dict with
+        "ok" set when the query succeeded; cached on the instance. Callers
+        fall back to the per-PR helpers when "ok" is absent.
+        """
+        if self._pr_context is not None:
+            return self._pr_context
+
+        ctx: dict = {}
+        if check_command_available("gh"):
+            fields = ("number title state headRefName baseRefName url "
+                      "author { login } createdAt mergedAt closedAt")
+            parts = [
+                f'infra: repository(owner: "{GITHUB_ORG}", name: "dem2-infra") {{'
+                f' pullRequests(headRefName: "preview/{self.preview_id}", first: 1,'
+                f' states: OPEN, orderBy: {{field: CREATED_AT, direction: DESC}})'
+                f' {{ nodes {{ {fields} }} }} }}'
+            ]
+            if dem2_pr_number:
+                parts.append(
+                    f'dem2: repository(owner: "{GITHUB_ORG}", name: "dem2") {{'
+                    f' pullRequest(number: {dem2_pr_number}) {{ {fields} }} }}'
+                )
+            query = "query { " + " ".join(parts) + " }"
+
+            result = run_command(["gh", "api", "graphql", "-f", f"query={query}"], binary=True)
+            if result.returncode == 0:
+                try:
+                    payload = _json_loads(result.stdout)["data"]
+                    ctx["ok"] = True
+                    nodes = payload["infra"]["pullRequests"]["nodes"]
+                    if nodes:
+                        ctx["infra"] = _pr_info_from_graphql(nodes[0])
+                    dem2_node = (payload.get("dem2") or {}).get("pullRequest")
+                    if dem2_node:
+                        ctx["dem2"] = _pr_info_from_graphql(dem2_node)
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    ctx = {}
+
+        self._pr_context = ctx
+        return ctx
 
     def collect_info(self) -> dict:
         """Collect all preview environment information into a structured dictionary."""
@@ -770,28 +1370,37 @@ class PreviewEnvironment:
         }
 
         # Extract PR number if in format "pr-XX"
-        pr_match = re.match(r"^pr-(\d+)$", self.preview_id)
-        pr_number = int(pr_match.group(1)) if pr_match else None
-
-        # Collect dem2 repository info
-        data["repositories"]["dem2"] = self._collect_repo_info("dem2", DEM2_REPO, pr_number)
-
-        # Collect dem2-webui repository info
-        data["repositories"]["dem2-webui"] = self._collect_repo_info("dem2-webui", WEBUI_REPO, pr_number)
-
-        # Collect dem2-infra repository info
-        data["repositories"]["dem2-infra"] = self._collect_infra_info()
-
-        # Collect ArgoCD deployment info
-        data["argocd"] = self._collect_argocd_info()
-
-        # Collect GitHub Actions workflow status
-        data["workflows"] = self._collect_workflow_info()
-
-        # Collect summary
-        dem2_tag = check_git_tag(DEM2_REPO, f"preview-{self.preview_id}")
-        webui_tag = check_git_tag(WEBUI_REPO, f"preview-{self.preview_id}")
-        infra_branch = check_git_branch(INFRA_REPO, f"preview/{self.preview_id}")
+        pr_tail = _strip_prefix(self.preview_id, _PR_TAG_PREFIX)
+        pr_number = int(pr_tail) if pr_tail and pr_tail.isdigit() else None
+
+        # One bundled GitHub query serves the collectors below.
+        self._fetch_pr_context(pr_number)
+
+        # The probes below each block on independent external services
+        # (git, gh, kubectl, argocd), so run them concurrently and pay only
+        # the slowest round-trip instead of the sum.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            dem2_future = executor.submit(self._collect_repo_info, "dem2", DEM2_REPO, pr_number)
+            webui_future = executor.submit(self._collect_repo_info, "dem2-webui", WEBUI_REPO, pr_number)
+            infra_future = executor.submit(self._collect_infra_info)
+            argocd_future = executor.submit(self._collect_argocd_info)
+            workflow_future = executor.submit(self._collect_workflow_info)
+
+            # Summary probes are independent of the collectors above, so
+            # they ride the same pool instead of running serially after it.
+            dem2_tag_future = executor.submit(check_git_tag, DEM2_REPO, f"preview-{self.preview_id}")
+            webui_tag_future = executor.submit(check_git_tag, WEBUI_REPO, f"preview-{self.preview_id}")
+            infra_branch_future = executor.submit(check_git_branch, INFRA_REPO, f"preview/{self.preview_id}")
+
+            data["repositories"]["dem2"] = dem2_future.result()
+            data["repositories"]["dem2-webui"] = webui_future.result()
+            data["repositories"]["dem2-infra"] = infra_future.result()
+            data["argocd"] = argocd_future.result()
+            data["workflows"] = workflow_future.result()
+
+            dem2_tag = dem2_tag_future.result()
+            webui_tag = webui_tag_future.result()
+            infra_branch = infra_branch_future.result()
 
         data["summary"] = {
             "has_dem2_tag": dem2_tag.exists,
@@ -820,7 +1429,11 @@ class PreviewEnvironment:
 
         # Collect PR info if we have a number
         if pr_number:
-            pr_info = get_pr_info(repo_name, pr_number)
+            ctx = self._pr_context or {}
+            if repo_name == "dem2" and ctx.get("ok"):
+                pr_info = ctx.get("dem2")
+            else:
+                pr_info = get_pr_info(repo_name, pr_number)
             if pr_info:
                 info["pr"] = {
                     "number": pr_number,
@@ -852,32 +1465,22 @@ class PreviewEnvironment:
         info["branch"]["location"] = branch_info.location if branch_info.exists else None
 
         # Look for associated PR
-        if check_command_available("gh"):
-            result = run_command([
-                "gh", "pr", "list",
-                "--repo", f"{GITHUB_ORG}/dem2-infra",
-                "--head", f"preview/{self.preview_id}",
-                "--json", "number,title,state,url,author,createdAt,mergedAt,closedAt",
-                "--limit", "1"
-            ])
-
-            if result.returncode == 0 and result.stdout.strip():
-                try:
-                    prs = json.loads(result.stdout)
-                    if prs:
-                        pr_data = prs[0]
-                        info["pr"] = {
-                            "number": pr_data["number"],
-                            "title": pr_data["title"],
-                            "state": pr_data["state"],
-                            "author": pr_data["author"]["login"],
-                            "created_at": pr_data["createdAt"],
-                            "merged_at": pr_data.get("mergedAt"),
-                            "closed_at": pr_data.get("closedAt"),
-                            "url": pr_data["url"]
-                        }
-                except (json.JSONDecodeError, KeyError):
-                    pass
+        ctx = self._pr_context or {}
+        if ctx.get("ok"):
+            pr_info = ctx.get("infra")
+        else:
+            pr_info = get_pr_info_by_branch("dem2-infra", f"preview/{self.preview_id}")
+        if pr_info:
+            info["pr"] = {
+                "number": pr_info.number,
+                "title": pr_info.title,
+                "state": pr_info.state,
+                "author": pr_info.author,
+                "created_at": pr_info.created_at,
+                "merged_at": pr_info.merged_at,
+                "closed_at": pr_info.closed_at,
+                "url": pr_info.url
+            }
 
         return info
 
@@ -990,139 +1593,141 @@ class PreviewEnvironment:
 
     def _show_info_markdown(self, data: dict) -> None:
         """Display information in Markdown table format (single giant table)."""
-        print(f"# Preview Environment: {data['preview_id']}\n")
-
-        print("| Section | Field | Value |")
-        print("|---------|-------|-------|")
-
-        # Identifier Resolution
-        print(f"| **Identifier** | Input Type | {data['identifier']['type']} |")
-        print(f"| **Identifier** | Input Value | {data['identifier']['value']} |")
-        print(f"| **Identifier** | Resolved Preview ID | {data['preview_id']} |")
-
-        # dem2 Repository
-        dem2 = data["repositories"]["dem2"]
-        print(f"| **dem2 (Backend)** | Preview Tag | {'✅ ' + dem2['tag']['name'] if dem2['tag']['exists'] else '❌ Not found'} |")
-        if dem2['tag']['exists']:
-            if dem2['tag']['commit']:
-                print(f"| **dem2 (Backend)** | Tag Commit | {dem2['tag']['commit']} |")
-            if dem2['tag']['date']:
-                print(f"| **dem2 (Backend)** | Tag Date | {dem2['tag']['date']} |")
-        if dem2['pr']:
-            pr = dem2['pr']
-            status_emoji = "✅" if pr['state'] == "OPEN" else "🔵" if pr['state'] == "MERGED" else "❌"
-            print(f"| **dem2 (Backend)** | PR #{pr['number']} | {pr['title']} |")
-            print(f"| **dem2 (Backend)** | PR Status | {status_emoji} {pr['state']} |")
-            print(f"| **dem2 (Backend)** | PR Branch | {pr['branch']} |")
-            print(f"| **dem2 (Backend)** | PR Author | {pr['author']} |")
-            print(f"| **dem2 (Backend)** | PR Created | {format_timestamp(pr['created_at'])} |")
-            print(f"| **dem2 (Backend)** | PR URL | {pr['url']} |")
-
-        # dem2-webui Repository
-        webui = data["repositories"]["dem2-webui"]
-        print(f"| **dem2-webui (Frontend)** | Preview Tag | {'✅ ' + webui['tag']['name'] if webui['tag']['exists'] else '❌ Not found'} |")
-        if webui['tag']['exists']:
-            if webui['tag']['commit']:
-                print(f"| **dem2-webui (Frontend)** | Tag Commit | {webui['tag']['commit']} |")
-            if webui['tag']['date']:
-                print(f"| **dem2-webui (Frontend)** | Tag Date | {webui['tag']['date']} |")
-        if webui['pr']:
-            pr = webui['pr']
-            status_emoji = "✅" if pr['state'] == "OPEN" else "🔵" if pr['state'] == "MERGED" else "❌"
-            print(f"| **dem2-webui (Frontend)** | PR #{pr['number']} | {pr['title']} |")
-            print(f"| **dem2-webui (Frontend)** | PR Status | {status_emoji} {pr['state']} |")
-            print(f"| **dem2-webui (Frontend)** | PR Branch | {pr['branch']} |")
-            print(f"| **dem2-webui (Frontend)** | PR Author | {pr['author']} |")
-            print(f"| **dem2-webui (Frontend)** | PR Created | {format_timestamp(pr['created_at'])} |")
-            print(f"| **dem2-webui (Frontend)** | PR URL | {pr['url']} |")
-
-        # Infrastructure
-        infra = data["repositories"]["dem2-infra"]
-        branch_status = f"{infra['branch']['location']}" if infra['branch']['exists'] else "NOT_FOUND"
-        print(f"| **dem2-infra (Infrastructure)** | Preview Branch | {infra['branch']['name']}: {branch_status} |")
-        if infra['pr']:
-            pr = infra['pr']
-            status_emoji = "✅" if pr['state'] == "OPEN" else "🔵" if pr['state'] == "MERGED" else "❌"
-            print(f"| **dem2-infra (Infrastructure)** | PR #{pr['number']} | {pr['title']} |")
-            print(f"| **dem2-infra (Infrastructure)** | PR Status | {status_emoji} {pr['state']} |")
-            print(f"| **dem2-infra (Infrastructure)** | PR Author | {pr['author']} |")
-            print(f"| **dem2-infra (Infrastructure)** | PR Created | {format_timestamp(pr['created_at'])} |")
-            print(f"| **dem2-infra (Infrastructure)** | PR URL | {pr['url']} |")
-        else:
-            print(f"| **dem2-infra (Infrastructure)** | Infra PR | ⚪ Not found |")
-
-        # ArgoCD Deployment
-        argocd = data["argocd"]
-        if argocd['infra_pr_number']:
-            print(f"| **ArgoCD** | Application Name | {argocd['app_name']} (based on infra PR #{argocd['infra_pr_number']}) |")
-        else:
-            print(f"| **ArgoCD** | Application Name | {argocd['app_name']} (infra PR not found, using fallback) |")
-        print(f"| **ArgoCD** | URL | {argocd['url']} |")
-        if argocd['sync_status']:
-            print(f"| **ArgoCD** | Sync Status | {argocd['sync_status']} |")
-            print(f"| **ArgoCD** | Health Status | {argocd['health_status']} |")
-        elif argocd['available']:
-            print(f"| **ArgoCD** | Status | ⚪ Cannot retrieve (app may not exist) |")
-        else:
-            print(f"| **ArgoCD** | Status | ⚪ ArgoCD CLI not available |")
-
-        # GitHub Actions Workflows
-        workflows = data.get("workflows", {})
-        if workflows.get("available", False):
-            for repo in ["dem2", "dem2-webui", "dem2-infra"]:
-                run = workflows.get(repo)
-                if run:
-                    status_emoji = self._get_workflow_status_emoji(run['status'], run['conclusion'], with_color=False)
-                    status_text = run['conclusion'] or run['status']
-                    print(f"| **Workflows** | {repo} | {status_emoji} {status_text} - {run['display_title'][:35]} |")
-                else:
-                    print(f"| **Workflows** | {repo} | ⚪ No recent workflow runs |")
-        else:
-            print(f"| **Workflows** | Status | ⚪ gh CLI not available |")
+        with buffered_output():
+            _emit(f"# Preview Environment: {data['preview_id']}\n")
+
+            _emit("| Section | Field | Value |")
+            _emit("|---------|-------|-------|")
+
+            # Identifier Resolution
+            _emit(f"| **Identifier** | Input Type | {data['identifier']['type']} |")
+            _emit(f"| **Identifier** | Input Value | {data['identifier']['value']} |")
+            _emit(f"| **Identifier** | Resolved Preview ID | {data['preview_id']} |")
+
+            # dem2 Repository
+            dem2 = data["repositories"]["dem2"]
+            _emit(f"| **dem2 (Backend)** | Preview Tag | {'✅ ' + dem2['tag']['name'] if dem2['tag']['exists'] else '❌ Not found'} |")
+            if dem2['tag']['exists']:
+                if dem2['tag']['commit']:
+                    _emit(f"| **dem2 (Backend)** | Tag Commit | {dem2['tag']['commit']} |")
+                if dem2['tag']['date']:
+                    _emit(f"| **dem2 (Backend)** | Tag Date | {dem2['tag']['date']} |")
+            if dem2['pr']:
+                pr = dem2['pr']
+                status_emoji = "✅" if pr['state'] == "OPEN" else "🔵" if pr['state'] == "MERGED" else "❌"
+                _emit(f"| **dem2 (Backend)** | PR #{pr['number']} | {pr['title']} |")
+                _emit(f"| **dem2 (Backend)** | PR Status | {status_emoji} {pr['state']} |")
+                _emit(f"| **dem2 (Backend)** | PR Branch | {pr['branch']} |")
+                _emit(f"| **dem2 (Backend)** | PR Author | {pr['author']} |")
+                _emit(f"| **dem2 (Backend)** | PR Created | {format_timestamp(pr['created_at'])} |")
+                _emit(f"| **dem2 (Backend)** | PR URL | {pr['url']} |")
+
+            # dem2-webui Repository
+            webui = data["repositories"]["dem2-webui"]
+            _emit(f"| **dem2-webui (Frontend)** | Preview Tag | {'✅ ' + webui['tag']['name'] if webui['tag']['exists'] else '❌ Not found'} |")
+            if webui['tag']['exists']:
+                if webui['tag']['commit']:
+                    _emit(f"| **dem2-webui (Frontend)** | Tag Commit | {webui['tag']['commit']} |")
+                if webui['tag']['date']:
+                    _emit(f"| **dem2-webui (Frontend)** | Tag Date | {webui['tag']['date']} |")
+            if webui['pr']:
+                pr = webui['pr']
+                status_emoji = "✅" if pr['state'] == "OPEN" else "🔵" if pr['state'] == "MERGED" else "❌"
+                _emit(f"| **dem2-webui (Frontend)** | PR #{pr['number']} | {pr['title']} |")
+                _emit(f"| **dem2-webui (Frontend)** | PR Status | {status_emoji} {pr['state']} |")
+                _emit(f"| **dem2-webui (Frontend)** | PR Branch | {pr['branch']} |")
+                _emit(f"| **dem2-webui (Frontend)** | PR Author | {pr['author']} |")
+                _emit(f"| **dem2-webui (Frontend)** | PR Created | {format_timestamp(pr['created_at'])} |")
+                _emit(f"| **dem2-webui (Frontend)** | PR URL | {pr['url']} |")
+
+            # Infrastructure
+            infra = data["repositories"]["dem2-infra"]
+            branch_status = f"{infra['branch']['location']}" if infra['branch']['exists'] else "NOT_FOUND"
+            _emit(f"| **dem2-infra (Infrastructure)** | Preview Branch | {infra['branch']['name']}: {branch_status} |")
+            if infra['pr']:
+                pr = infra['pr']
+                status_emoji = "✅" if pr['state'] == "OPEN" else "🔵" if pr['state'] == "MERGED" else "❌"
+                _emit(f"| **dem2-infra (Infrastructure)** | PR #{pr['number']} | {pr['title']} |")
+                _emit(f"| **dem2-infra (Infrastructure)** | PR Status | {status_emoji} {pr['state']} |")
+                _emit(f"| **dem2-infra (Infrastructure)** | PR Author | {pr['author']} |")
+                _emit(f"| **dem2-infra (Infrastructure)** | PR Created | {format_timestamp(pr['created_at'])} |")
+                _emit(f"| **dem2-infra (Infrastructure)** | PR URL | {pr['url']} |")
+            else:
+                _emit(f"| **dem2-infra (Infrastructure)** | Infra PR | ⚪ Not found |")
 
-        # Summary
-        summary = data["summary"]
-        if not summary["is_clean"]:
-            artifacts = []
-            if summary["has_dem2_tag"]:
-                artifacts.append(f"dem2 tag: preview-{data['preview_id']}")
-            if summary["has_webui_tag"]:
-                artifacts.append(f"webui tag: preview-{data['preview_id']}")
-            if summary["has_infra_branch"]:
-                artifacts.append(f"infra branch: preview/{data['preview_id']}")
-            print(f"| **Summary** | Artifacts | {', '.join(artifacts)} |")
-        else:
-            print(f"| **Summary** | Status | ✅ No preview artifacts found - environment is clean |")
+            # ArgoCD Deployment
+            argocd = data["argocd"]
+            if argocd['infra_pr_number']:
+                _emit(f"| **ArgoCD** | Application Name | {argocd['app_name']} (based on infra PR #{argocd['infra_pr_number']}) |")
+            else:
+                _emit(f"| **ArgoCD** | Application Name | {argocd['app_name']} (infra PR not found, using fallback) |")
+            _emit(f"| **ArgoCD** | URL | {argocd['url']} |")
+            if argocd['sync_status']:
+                _emit(f"| **ArgoCD** | Sync Status | {argocd['sync_status']} |")
+                _emit(f"| **ArgoCD** | Health Status | {argocd['health_status']} |")
+            elif argocd['available']:
+                _emit(f"| **ArgoCD** | Status | ⚪ Cannot retrieve (app may not exist) |")
+            else:
+                _emit(f"| **ArgoCD** | Status | ⚪ ArgoCD CLI not available |")
+
+            # GitHub Actions Workflows
+            workflows = data.get("workflows", {})
+            if workflows.get("available", False):
+                for repo in ["dem2", "dem2-webui", "dem2-infra"]:
+                    run = workflows.get(repo)
+                    if run:
+                        status_emoji = self._get_workflow_status_emoji(run['status'], run['conclusion'], with_color=False)
+                        status_text = run['conclusion'] or run['status']
+                        _emit(f"| **Workflows** | {repo} | {status_emoji} {status_text} - {run['display_title'][:35]} |")
+                    else:
+                        _emit(f"| **Workflows** | {repo} | ⚪ No recent workflow runs |")
+            else:
+                _emit(f"| **Workflows** | Status | ⚪ gh CLI not available |")
+
+            # Summary
+            summary = data["summary"]
+            if not summary["is_clean"]:
+                artifacts = []
+                if summary["has_dem2_tag"]:
+                    artifacts.append(f"dem2 tag: preview-{data['preview_id']}")
+                if summary["has_webui_tag"]:
+                    artifacts.append(f"webui tag: preview-{data['preview_id']}")
+                if summary["has_infra_branch"]:
+                    artifacts.append(f"infra branch: preview/{data['preview_id']}")
+                _emit(f"| **Summary** | Artifacts | {', '.join(artifacts)} |")
+            else:
+                _emit(f"| **Summary** | Status | ✅ No preview artifacts found - environment is clean |")
 
     def _show_info_terminal(self, data: dict) -> None:
         """Display information in terminal format (original colorized output)."""
-        print_header(f"Preview Environment: {data['preview_id']}")
+        with buffered_output():
+            print_header(f"Preview Environment: {data['preview_id']}")
 
-        # Show identifier resolution
-        print()
-        print_color(Color.CYAN, "Identifier Resolution:")
-        print_kv("  Input Type", data['identifier']['type'])
-        print_kv("  Input Value", data['identifier']['value'])
-        print_kv("  Resolved Preview ID", data['preview_id'])
-        print()
+            # Show identifier resolution
+            _emit()
+            print_color(Color.CYAN, "Identifier Resolution:")
+            print_kv("  Input Type", data['identifier']['type'])
+            print_kv("  Input Value", data['identifier']['value'])
+            print_kv("  Resolved Preview ID", data['preview_id'])
+            _emit()
 
-        # Show dem2 repository
-        self._show_repo_info_terminal(data['repositories']['dem2'], "Backend")
+            # Show dem2 repository
+            self._show_repo_info_terminal(data['repositories']['dem2'], "Backend")
 
-        # Show dem2-webui repository
-        self._show_repo_info_terminal(data['repositories']['dem2-webui'], "Frontend")
+            # Show dem2-webui repository
+            self._show_repo_info_terminal(data['repositories']['dem2-webui'], "Frontend")
 
-        # Show dem2-infra repository
-        self._show_infra_info_terminal(data['repositories']['dem2-infra'])
+            # Show dem2-infra repository
+            self._show_infra_info_terminal(data['repositories']['dem2-infra'])
 
-        # Show ArgoCD deployment
-        self._show_argocd_info_terminal(data['argocd'])
+            # Show ArgoCD deployment
+            self._show_argocd_info_terminal(data['argocd'])
 
-        # Show GitHub Actions workflows
-        self._show_workflow_info_terminal(data.get('workflows', {}))
+            # Show GitHub Actions workflows
+            self._show_workflow_info_terminal(data.get('workflows', {}))
 
-        # Show summary
-        self._show_summary_terminal(data['summary'], data['preview_id'])
+            # Show summary
+            self._show_summary_terminal(data['summary'], data['preview_id'])
 
     def _show_repo_info_terminal(self, repo: dict, label: str) -> None:
         """Show repository information in terminal format."""
@@ -1260,21 +1865,56 @@ class PreviewEnvironment:
 
         # Show artifact summary
         if not summary['is_clean']:
-            print()
+            _emit()
             print_color(Color.CYAN, "  Preview Environment Artifacts:")
 
             if summary['has_dem2_tag']:
-                print(f"    • dem2 has preview tag: preview-{preview_id}")
+                _emit(f"    • dem2 has preview tag: preview-{preview_id}")
 
             if summary['has_webui_tag']:
-                print(f"    • dem2-webui has preview tag: preview-{preview_id}")
+                _emit(f"    • dem2-webui has preview tag: preview-{preview_id}")
 
             if summary['has_infra_branch']:
-                print(f"    • dem2-infra has preview branch: preview/{preview_id}")
+                _emit(f"    • dem2-infra has preview branch: preview/{preview_id}")
         else:
             print_color(Color.GREEN, f"  {Symbol.CHECK} No preview artifacts found - environment is clean")
 
-        print()
+        _emit()
+
+    def _delete_tag_in_repo(self, repo_name: str, repo_path: Path) -> Tuple[bool, List[str]]:
+        """Remove the preview tag locally and on origin for one repository.
+
+        Returns (removed, output_lines); the caller prints the lines so
+        concurrent workers don't interleave their reports. Local and
+        remote deletion run as one concurrent batch, and the remote side
+        uses a single `git push --delete`.
+        """
+        tag = f"preview-{self.preview_id}"
+        lines = [f"{Color.CYAN}Processing {repo_name}...{Color.NC}"]
+
+        if not _repo_exists(repo_path):
+            lines.append(f"{Color.YELLOW}  {Symbol.WARN} Repository not found: {repo_path}{Color.NC}")
+            return False, lines
+
+        if not _tag_exists(repo_path, tag):
+            lines.append(f"{Color.GRAY}  {Symbol.CIRCLE} Tag doesn't exist in {repo_name}{Color.NC}")
+            return False, lines
+
+        local_result, remote_result = run_many([
+            _git_argv(repo_path, "tag", "-d", tag),
+            _git_argv(repo_path, "push", "--delete", "origin", f"refs/tags/{tag}"),
+        ])
+
+        if local_result.returncode == 0:
+            lines.append(f"  {local_result.stdout.strip()}")
+
+        if remote_result.returncode == 0:
+            lines.append(f"  {remote_result.stdout.strip()}")
+            lines.append(f"{Color.GREEN}  {Symbol.CHECK} Removed {tag} from {repo_name}{Color.NC}")
+        else:
+            lines.append(f"{Color.YELLOW}  {Symbol.WARN} Tag not on remote or already deleted{Color.NC}")
+
+        return True, lines
 
     def delete(self) -> None:
         """Delete the preview environment (tags, close PR, trigger ArgoCD cleanup)."""
@@ -1308,40 +1948,23 @@ class PreviewEnvironment:
         removed_count = 0
         skipped_count = 0
 
-        for repo_name, repo_path in [("dem2", DEM2_REPO), ("dem2-webui", WEBUI_REPO)]:
-            print()
-            print_color(Color.CYAN, f"Processing {repo_name}...")
-
-            if not repo_path.exists():
-                print_color(Color.YELLOW, f"  {Symbol.WARN} Repository not found: {repo_path}")
-                skipped_count += 1
-                continue
-
-            tag = f"preview-{self.preview_id}"
-            result = run_command(["git", "-C", str(repo_path), "rev-parse", tag])
-
-            if result.returncode == 0:
-                # Delete local tag
-                result = run_command(["git", "-C", str(repo_path), "tag", "-d", tag])
-                if result.returncode == 0:
-                    print(f"  {result.stdout.strip()}")
-
-                # Delete remote tag
-                result = run_command([
-                    "git", "-C", str(repo_path), "push", "origin",
-                    f":refs/tags/{tag}"
-                ])
-
-                if result.returncode == 0:
-                    print(f"  {result.stdout.strip()}")
-                    print_color(Color.GREEN, f"  {Symbol.CHECK} Removed {tag} from {repo_name}")
+        # The two repo deletions are independent and dominated by the
+        # remote push round-trip, so run them concurrently. Each worker
+        # returns its output lines so the report stays ordered per repo.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._delete_tag_in_repo, repo_name, repo_path)
+                for repo_name, repo_path in [("dem2", DEM2_REPO), ("dem2-webui", WEBUI_REPO)]
+            ]
+            for future in futures:
+                removed, lines = future.result()
+                print()
+                for line in lines:
+                    print(line)
+                if removed:
                     removed_count += 1
                 else:
-                    print_color(Color.YELLOW, f"  {Symbol.WARN} Tag not on remote or already deleted")
-                    removed_count += 1
-            else:
-                print_color(Color.GRAY, f"  {Symbol.CIRCLE} Tag doesn't exist in {repo_name}")
-                skipped_count += 1
+                    skipped_count += 1
 
         # Summary
         print()
@@ -1364,6 +1987,17 @@ class PreviewEnvironment:
         print()
 
 
+# Dispatch table for resolve(): one dict lookup instead of walking the
+# six-branch if/elif chain with an enum comparison per arm.
+_RESOLVERS = {
+    IdentifierType.GIT_TAG: PreviewEnvironment._resolve_git_tag,
+    IdentifierType.ARGOCD_APP: PreviewEnvironment._resolve_argocd_app,
+    IdentifierType.GKE_NAMESPACE: PreviewEnvironment._resolve_gke_namespace,
+    IdentifierType.INFRA_BRANCH: PreviewEnvironment._resolve_infra_branch,
+    IdentifierType.PR: PreviewEnvironment._resolve_pr,
+    IdentifierType.GIT_BRANCH: PreviewEnvironment._resolve_git_branch,
+}
+
 
 # ============================================================
 # Preview Tagging Operations
@@ -1378,9 +2012,8 @@ def get_current_branch(repo_path: Path) -> str:
     if not repo_path.exists():
         raise PreviewToolError(f"Repository not found: {repo_path}")
 
-    result = run_command([
-        "git", "-C", str(repo_path), "rev-parse", "--abbrev-ref", "HEAD"
-    ], check=False)
+    result = run_command(_git_argv(repo_path, "rev-parse", "--abbrev-ref", "HEAD"
+    ), check=False)
 
     if result.returncode != 0:
         raise PreviewToolError(f"Could not determine current branch in {repo_path}")
@@ -1444,17 +2077,15 @@ def tag_repository(repo_name: str, repo_path: Path) -> str:
     print_color(Color.CYAN, f"Tagging {repo_name} (branch: {branch}) with {tag_name}...")
 
     # Create tag
-    result = run_command([
-        "git", "-C", str(repo_path), "tag", "-f", tag_name
-    ], check=False)
+    result = run_command(_git_argv(repo_path, "tag", "-f", tag_name
+    ), check=False)
 
     if result.returncode != 0:
         raise PreviewToolError(f"Failed to create tag in {repo_name}: {result.stderr}")
 
     # Push tag
-    result = run_command([
-        "git", "-C", str(repo_path), "push", "origin", tag_name, "--force"
-    ], check=False, capture_output=False)
+    result = run_command(_git_argv(repo_path, "push", "origin", tag_name, "--force"
+    ), check=False, capture_output=False)
 
     if result.returncode != 0:
         raise PreviewToolError(f"Failed to push tag in {repo_name}")
@@ -1468,7 +2099,7 @@ def tag_repository(repo_name: str, repo_path: Path) -> str:
 # CLI Commands
 # ============================================================
 
-def cmd_info(args: argparse.Namespace) -> None:
+def cmd_info(args: "argparse.Namespace") -> None:
     """Show detailed information about a preview environment."""
     id_type, identifier = _parse_identifier_args(args)
     output_format = getattr(args, 'format', 'terminal')
@@ -1481,7 +2112,7 @@ def cmd_info(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def cmd_delete(args: argparse.Namespace) -> None:
+def cmd_delete(args: "argparse.Namespace") -> None:
     """Delete preview environment (tags, close PR, trigger ArgoCD cleanup)."""
     id_type, identifier = _parse_identifier_args(args)
 
@@ -1493,7 +2124,7 @@ def cmd_delete(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def cmd_tag(args: argparse.Namespace) -> None:
+def cmd_tag(args: "argparse.Namespace") -> None:
     """Tag repository/repositories to create/update preview environment."""
     repo = args.repo
 
@@ -1568,7 +2199,23 @@ def cmd_tag(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def _parse_identifier_args(args: argparse.Namespace) -> Tuple[IdentifierType, str]:
+# Composed once: the identifier help block is immutable, and writing it
+# as a single string costs one stdout write instead of a print per line.
+# Shared with the argument parser epilog in main().
+_MISSING_ID_HELP = "\n".join([
+    "",
+    "Use one of:",
+    "  --git-tag <tag>              Git tag (preview-docproc-extraction-pipeline)",
+    "  --argocd-app <app>           ArgoCD app name (preview-pr-91)",
+    "  --gke-namespace <ns>         GKE namespace (tusdi-preview-91)",
+    "  --infra-branch <branch>      dem2-infra branch (preview/docproc-extraction-pipeline)",
+    "  --pr <number>                PR number (421)",
+    "  --git-branch <branch>        Git branch (feature/docproc-extraction-pipeline)",
+    "",
+])
+
+
+def _parse_identifier_args(args: "argparse.Namespace") -> Tuple[IdentifierType, str]:
     """Parse identifier arguments from argparse namespace."""
     if args.git_tag:
         return IdentifierType.GIT_TAG, args.git_tag
@@ -1582,16 +2229,11 @@ def _parse_identifier_args(args: argparse.Namespace) -> Tuple[IdentifierType, st
         return IdentifierType.PR, args.pr
     elif args.git_branch:
         return IdentifierType.GIT_BRANCH, args.git_branch
+    elif args.identifier:
+        return classify_identifier(args.identifier), args.identifier
     else:
         print_color(Color.RED, "Error: You must specify the type of identifier")
-        print()
-        print("Use one of:")
-        print("  --git-tag <tag>              Git tag (preview-docproc-extraction-pipeline)")
-        print("  --argocd-app <app>           ArgoCD app name (preview-pr-91)")
-        print("  --gke-namespace <ns>         GKE namespace (tusdi-preview-91)")
-        print("  --infra-branch <branch>      dem2-infra branch (preview/docproc-extraction-pipeline)")
-        print("  --pr <number>                PR number (421)")
-        print("  --git-branch <branch>        Git branch (feature/docproc-extraction-pipeline)")
+        sys.stdout.write(_MISSING_ID_HELP)
         sys.exit(1)
 
 
@@ -1601,8 +2243,13 @@ def _parse_identifier_args(args: argparse.Namespace) -> Tuple[IdentifierType, st
 
 def main() -> None:
     """Main CLI entry point."""
+    # Deferred: argparse costs a few ms at import and only main() needs it,
+    # which matters for the --help/usage-error paths.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Utility for managing preview environments, PRs, and deployments",
+        epilog=_MISSING_ID_HELP,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
@@ -1612,6 +2259,8 @@ def main() -> None:
     def add_identifier_args(subparser: argparse.ArgumentParser) -> None:
         """Add identifier arguments to a subparser."""
         id_group = subparser.add_argument_group("identifier options (one required)")
+        id_group.add_argument("identifier", nargs="?", metavar="IDENTIFIER",
+                              help="Bare identifier; type is inferred from its shape (preview-*, preview/*, tusdi-preview-*, PR number)")
         id_group.add_argument("--git-tag", metavar="TAG", help="Git tag (preview-docproc-extraction-pipeline)")
         id_group.add_argument("--argocd-app", metavar="APP", help="ArgoCD app name (preview-pr-91)")
         id_group.add_argument("--gke-namespace", metavar="NS", help="GKE namespace (tusdi-preview-91)")